@@ -21,26 +21,71 @@ Author: POWER-BHOOMI Team
 import os
 import sys
 import json
+import operator
 import time
 import logging
+import logging.handlers
 import threading
 import queue
 import platform
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, field, asdict
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, fields
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
+from functools import lru_cache
+import atexit
 import csv
+import gzip
+import io
+import hashlib
+import itertools
+import re
 import traceback
+from urllib.parse import quote
+from pathlib import Path
 
 # Flask imports
-from flask import Flask, render_template_string, jsonify, request
+from flask import Flask, Response, render_template_string, jsonify, request, stream_with_context
 from flask_cors import CORS
 
+# Optional: brotli-compressed UI assets (gzip is always available)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Optional: faster JSON for record-heavy responses (stdlib json otherwise)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def dumps_json(obj) -> bytes:
+    """Compact UTF-8 JSON; Kannada text is sent as-is rather than \\u-escaped"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def loads_json(data):
+    """Parse JSON text or bytes with orjson when available (ValueError on bad input either way)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Optional: C-backed HTML parser for owner extraction (html.parser otherwise)
+try:
+    import lxml  # noqa: F401 - used through BeautifulSoup's 'lxml' tree builder
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 # HTTP imports
 import requests
+from requests.adapters import HTTPAdapter
 import urllib3
+from urllib3.util.retry import Retry
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -53,6 +98,7 @@ class Config:
     HOST = '0.0.0.0'
     PORT = 5001
     DEBUG = True
+    SERVER_THREADS = 16  # waitress threads (status streams + downloads + API)
     
     # Parallel Processing - 4 fast workers for Mac
     MAX_WORKERS = 4
@@ -61,6 +107,7 @@ class Config:
     # Timeouts (seconds) - Optimized for Mac speed
     PAGE_LOAD_TIMEOUT = 20
     ELEMENT_WAIT_TIMEOUT = 8
+    DROPDOWN_POLL_INTERVAL = 0.1  # Poll for a cascaded dropdown's options this often
     POST_CLICK_WAIT = 4  # Faster clicks
     POST_SELECT_WAIT = 1.5  # Faster selections
     
@@ -85,6 +132,49 @@ class Config:
     VERIFY_PAGE_LOAD = True  # Verify page loaded after each action
     LOG_SKIPPED_ITEMS = True  # Log all skipped items for later retry
     
+    # Location lists (districts/taluks/hoblis/villages) rarely change
+    API_CACHE_TTL = 6 * 3600  # Seconds an upstream lookup is reused
+    API_CACHE_MAX_ENTRIES = 4096  # LRU bound on cached lookups
+    LIST_MAX_AGE = 3600  # Browser Cache-Control max-age for location lists
+    API_POOL_CONNECTIONS = 4  # Hosts kept in the requests connection pool
+    API_POOL_MAXSIZE = 16  # Keep-alive connections per host (matches SERVER_THREADS)
+    
+    # On-the-fly gzip for JSON API responses (status, records, lists)
+    JSON_GZIP_MIN_SIZE = 1024  # Bytes; smaller bodies are sent as-is
+    JSON_GZIP_LEVEL = 5  # Favour speed, these are rebuilt every poll
+    
+    # Live CSV backups (ThreadSafeCSVWriter)
+    CSV_BUFFER_SIZE = 1 << 16  # Bytes of write buffer per file
+    CSV_FLUSH_ROWS = 64  # Flush after this many buffered rows...
+    CSV_FLUSH_INTERVAL = 1.0  # ...or this many seconds, whichever comes first
+    CSV_QUEUE_SIZE = 10000  # Rows queued before workers block on the writer
+    CSV_BATCH_ROWS = 256  # Rows per writerows() call
+    
+    # Per-worker record batching (DB + CSV writes)
+    WORKER_FLUSH_ROWS = 64  # Write a worker's buffered records after this many...
+    WORKER_FLUSH_INTERVAL = 5.0  # ...or once the oldest has waited this many seconds
+    
+    # Village progress writes are coalesced in DatabaseManager
+    PROGRESS_FLUSH_UPDATES = 50  # Flush after this many progress updates...
+    PROGRESS_FLUSH_INTERVAL = 2.0  # ...or this many seconds since the last flush
+    DB_WAL_SIZE_LIMIT = 64 * 1024 * 1024  # Bytes the WAL file is trimmed to after checkpoints
+    DB_WRITE_QUEUE_SIZE = 10000  # Queued record batches before savers block
+    DB_WRITE_BATCH_ROWS = 1000  # Rows per executemany/commit in the record writer
+    DB_WRITE_RETRY_DELAY = 0.5  # First wait before retrying a batch the DB was locked for...
+    DB_WRITE_RETRY_MAX_DELAY = 5.0  # ...doubling up to this many seconds per retry
+    
+    # In-memory UI buffers (everything is also in SQLite/CSV)
+    UI_LOG_LINES = 100  # Log lines kept for the log panel
+    UI_RECORD_ROWS = 500  # Recent record rows kept for the results tables
+    
+    # Status snapshot reuse across concurrent status readers
+    STATE_SNAPSHOT_TTL = 0.25  # Seconds
+    RECORD_COUNT_TTL = 5.0  # Seconds a get_all_records_count() result is reused
+    
+    # Status push (Server-Sent Events)
+    STATUS_STREAM_INTERVAL = 0.5  # Seconds between state checks per stream
+    STATUS_STREAM_HEARTBEAT = 15  # Keep-alive comment when nothing changed
+    
     # URLs
     ECHAWADI_BASE = "https://rdservices.karnataka.gov.in/echawadi/Home"
     SERVICE2_URL = "https://landrecords.karnataka.gov.in/Service2/"
@@ -102,23 +192,67 @@ class Config:
         'go_btn': 'ctl00_MainContent_btnCGo',
         'fetch_btn': 'ctl00_MainContent_btnCFetchDetails',
     }
+    
+    # Owner results table selection (checked for every table of every RTC page)
+    OWNER_TABLE_KEYWORDS = ('Owner', 'ಮಾಲೀಕರ', 'Extent', 'ವಿಸ್ತೀರ್ಣ', 'Khata', 'ಖಾತಾ')  # Needs one
+    FORM_TABLE_KEYWORDS = (  # Any of these marks the search form's own table
+        'Select District', 'Select Taluk', 'Select Hobli', 'Select Village',
+        'Select Survey', 'Select Surnoc', 'Select Hissa', 'Select Period',
+        'Toggle navigation'
+    )
+    
+    # Owner table row filtering (checked for every row of every RTC page)
+    MIN_OWNER_NAME_LENGTH = 3
+    OWNER_ROW_SKIP_PATTERNS = (  # Dropdown/form text leaking into the table
+        'Select ', 'Toggle ', 'District', 'Taluk', 'Hobli', 'Village',
+        'Survey Number', 'Surnoc', 'Hissa', 'Period', 'Year'
+    )
+    OWNER_HEADER_KEYWORDS = ('owner', 'extent', 'sl.no', 'slno', 'ಮಾಲೀಕರ', 'ಸ್ಥಿತಿ')  # Lower-case
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # LOGGING SETUP
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(levelname)-7s | %(name)-15s | %(message)s',
+# Workers only enqueue log records; one listener thread formats and writes
+# them, so a slow console never stalls a worker holding a lock
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter(
+    '%(asctime)s | %(levelname)-7s | %(name)-15s | %(message)s',
     datefmt='%H:%M:%S'
-)
+))
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_enqueue = logging.handlers.QueueHandler(_log_queue)
+_log_enqueue.setFormatter(logging.Formatter('%(message)s'))  # Only merges args; layout is _log_output's
+logging.basicConfig(level=logging.INFO, handlers=[_log_enqueue])
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output, respect_handler_level=True)
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Drains queued records on exit
 logger = logging.getLogger('POWER-BHOOMI')
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # DATA CLASSES
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+_iso_cache: Tuple[float, str] = (0.0, '')
+
+def _now_iso() -> str:
+    """datetime.now().isoformat(), reused for up to 100 ms across calls.
+    
+    Records and worker heartbeats are stamped in bursts; formatting a fresh
+    timestamp for each one costs more than the precision is worth.
+    """
+    global _iso_cache
+    now = time.time()
+    cached_at, stamp = _iso_cache
+    if now - cached_at >= 0.1 or now < cached_at:
+        stamp = datetime.fromtimestamp(now).isoformat()
+        _iso_cache = (now, stamp)  # One tuple, so readers never see a torn pair
+    return stamp
+
+# Per-record/per-worker classes use __slots__ where dataclasses support it (3.10+)
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class LandRecord:
     """Represents a single land record"""
     district: str
@@ -132,10 +266,17 @@ class LandRecord:
     owner_name: str
     extent: str
     khatah: str
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: str = field(default_factory=_now_iso)
     worker_id: int = 0
 
-@dataclass
+LAND_RECORD_FIELDS = tuple(f.name for f in fields(LandRecord))
+_land_record_values = operator.attrgetter(*LAND_RECORD_FIELDS)
+
+def land_record_dict(record: LandRecord) -> Dict[str, Any]:
+    """LandRecord as a dict; asdict() without the recursive deep copy (fields are scalars)"""
+    return dict(zip(LAND_RECORD_FIELDS, _land_record_values(record)))
+
+@dataclass(**_SLOTS)
 class WorkerStatus:
     """Status of a single worker"""
     worker_id: int
@@ -148,7 +289,7 @@ class WorkerStatus:
     records_found: int = 0
     matches_found: int = 0
     errors: int = 0
-    last_update: str = field(default_factory=lambda: datetime.now().isoformat())
+    last_update: str = field(default_factory=_now_iso)
 
 @dataclass
 class SearchState:
@@ -181,57 +322,181 @@ class SearchState:
     # Worker details
     workers: Dict[int, WorkerStatus] = field(default_factory=dict)
     
-    # Logs
-    logs: List[str] = field(default_factory=list)
+    # Logs (ring buffer of the latest UI_LOG_LINES)
+    logs: deque = field(default_factory=lambda: deque(maxlen=Config.UI_LOG_LINES))
+    logs_total: int = 0  # Lines ever logged, lets the UI fetch only new lines
     
     # File paths
     all_records_file: str = ''
     matches_file: str = ''
     
-    # Real-time records storage (for UI display)
-    all_records: List[Dict] = field(default_factory=list)
-    matches: List[Dict] = field(default_factory=list)
+    # Real-time records storage (for UI display). Rows are compact lists:
+    # [village, survey_no, hissa, owner_name, extent, khatah, worker_id, is_match]
+    # and the UI derives the matches view from the is_match flag. Every row is
+    # persisted by DatabaseManager; this ring buffer is only the UI window.
+    all_records: deque = field(default_factory=lambda: deque(maxlen=Config.UI_RECORD_ROWS))
+    all_records_total: int = 0  # Rows ever added, lets the UI fetch only new rows
+    
+    def add_log(self, message: str):
+        """Append a log line (caller holds the state lock)"""
+        self.logs.append(message)  # Oldest line drops off at maxlen
+        self.logs_total += 1
+    
+    def add_record_row(self, row: List):
+        """Append a UI record row (caller holds the state lock)"""
+        self.all_records.append(row)  # Oldest row drops off at maxlen
+        self.all_records_total += 1
+
+def _tail(items: deque, count: int) -> list:
+    """Last `count` items of a deque as a list (deques can't be sliced)"""
+    tail = list(itertools.islice(reversed(items), count))
+    tail.reverse()
+    return tail
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # THREAD-SAFE CSV WRITER
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
 class ThreadSafeCSVWriter:
-    """Thread-safe CSV writer for parallel access"""
+    """
+    Thread-safe CSV writer for parallel access.
+    
+    Workers only enqueue rows; one writer thread per file drains the queue
+    in batches of up to CSV_BATCH_ROWS through a single buffered handle and
+    DictWriter. Buffered rows are flushed every CSV_FLUSH_ROWS rows or
+    CSV_FLUSH_INTERVAL seconds, and on flush()/close().
+    """
+    
+    _CLOSE = object()  # Queue sentinel that stops the writer thread
     
     def __init__(self, filepath: str, fieldnames: List[str]):
         self.filepath = filepath
         self.fieldnames = fieldnames
-        self.lock = threading.Lock()
-        self._initialized = False
+        self.lock = threading.Lock()  # Guards the file handle
+        self._file = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+        self._closed = False
+        
+        with self.lock:
+            self._open('w')
+            self._writer.writeheader()
+            self._file.flush()
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=Config.CSV_QUEUE_SIZE)
+        self._thread = threading.Thread(
+            target=self._drain, name=f"csv-{os.path.basename(filepath)}", daemon=True
+        )
+        self._thread.start()
+    
+    def _open(self, mode: str):
+        """Open the file handle (under lock); 'a' reopens after close()"""
+        self._file = open(self.filepath, mode, newline='', encoding='utf-8',
+                          buffering=Config.CSV_BUFFER_SIZE)
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        atexit.register(self.close)
+    
+    def _write_rows(self, records: List[Dict[str, Any]]):
+        """Write rows and flush on a row/time boundary (under lock)"""
+        if self._file is None:
+            self._open('a')  # Late write from a worker after close()
+        self._writer.writerows(records)
+        self._unflushed += len(records)
+        
+        now = time.monotonic()
+        if self._unflushed >= Config.CSV_FLUSH_ROWS or now - self._last_flush >= Config.CSV_FLUSH_INTERVAL:
+            self._flush_file()
+    
+    def _flush_file(self):
+        """Push buffered rows to disk (under lock)"""
+        if self._file is not None and self._unflushed:
+            self._file.flush()
+            self._unflushed = 0
+            self._last_flush = time.monotonic()
     
-    def _initialize(self):
-        """Initialize CSV file with headers"""
-        if not self._initialized:
-            with open(self.filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                writer.writeheader()
-            self._initialized = True
+    def _drain(self):
+        """Writer thread: batch queued rows into writerows() calls"""
+        while True:
+            try:
+                item = self._queue.get(timeout=Config.CSV_FLUSH_INTERVAL)
+            except queue.Empty:
+                with self.lock:
+                    self._flush_file()  # Idle: don't sit on a partial buffer
+                continue
+            
+            batch = []
+            while item is not self._CLOSE:
+                batch.append(item)
+                if len(batch) >= Config.CSV_BATCH_ROWS:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                try:
+                    with self.lock:
+                        self._write_rows(batch)
+                except Exception as e:
+                    logger.error(f"CSV write failed for {self.filepath}: {e}")
+            for _ in range(len(batch) + (item is self._CLOSE)):
+                self._queue.task_done()
+            if item is self._CLOSE:
+                return
     
     def write_record(self, record: Dict[str, Any]):
         """Write a single record to CSV (thread-safe)"""
-        with self.lock:
-            if not self._initialized:
-                self._initialize()
-            
-            with open(self.filepath, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                writer.writerow(record)
+        if self._closed:
+            with self.lock:
+                self._write_rows((record,))
+        else:
+            self._queue.put(record)
     
     def write_records(self, records: List[Dict[str, Any]]):
         """Write multiple records to CSV (thread-safe)"""
+        if self._closed:
+            with self.lock:
+                self._write_rows(records)
+        else:
+            for record in records:
+                self._queue.put(record)
+    
+    def flush(self):
+        """Write out queued and buffered rows so the file can be read/downloaded"""
+        if not self._closed:
+            self._queue.join()
+        with self.lock:
+            self._flush_file()
+    
+    def close(self):
+        """Drain the queue, then flush and close the file (safe to call more than once)"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(self._CLOSE)
+            self._thread.join()
+        
         with self.lock:
-            if not self._initialized:
-                self._initialize()
+            # Rows queued by a worker that raced with close()
+            leftovers = []
+            while True:
+                try:
+                    leftovers.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if leftovers:
+                self._write_rows(leftovers)
             
-            with open(self.filepath, 'a', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                writer.writerows(records)
+            if self._file is None:
+                return
+            try:
+                self._file.close()
+            finally:
+                self._file = None
+                self._writer = None
+                self._unflushed = 0
+                atexit.unregister(self.close)
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # PERSISTENT DATABASE MANAGER (SQLite)
@@ -240,6 +505,57 @@ class ThreadSafeCSVWriter:
 import sqlite3
 from contextlib import contextmanager
 
+# Hot-path statements, kept as constants so every call hands sqlite3 the same
+# string and hits its prepared-statement cache (see cached_statements)
+_SQL_INSERT_RECORD = '''
+    INSERT INTO land_records (
+        session_id, district, taluk, hobli, village,
+        survey_no, surnoc, hissa, period,
+        owner_name, extent, khatah, is_match, worker_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_START_VILLAGE = '''
+    UPDATE village_progress
+    SET status = 'in_progress', started_at = CURRENT_TIMESTAMP, max_survey_no = ?
+    WHERE session_id = ? AND village_code = ?
+'''
+
+_SQL_UPDATE_PROGRESS = '''
+    UPDATE village_progress
+    SET last_survey_no = ?, records_found = records_found + ?, matches_found = matches_found + ?
+    WHERE session_id = ? AND village_code = ?
+'''
+
+_SQL_COMPLETE_VILLAGE = '''
+    UPDATE village_progress
+    SET status = 'completed', completed_at = CURRENT_TIMESTAMP,
+        records_found = ?, matches_found = ?
+    WHERE session_id = ? AND village_code = ?
+'''
+
+_SQL_FAIL_VILLAGE = '''
+    UPDATE village_progress
+    SET status = 'failed', error_message = ?
+    WHERE session_id = ? AND village_code = ?
+'''
+
+
+def _fetch_dicts(conn: sqlite3.Connection, sql: str, params=()) -> List[dict]:
+    """
+    Run a query and return its rows as plain dicts.
+    
+    The cursor yields bare tuples and the column names are read from
+    cursor.description once, instead of building a sqlite3.Row per row and
+    converting it with dict(row).
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    columns = [d[0] for d in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
 class DatabaseManager:
     """
     Thread-safe SQLite database manager for persistent storage.
@@ -257,6 +573,8 @@ class DatabaseManager:
     # Database version for migrations
     DB_VERSION = 1
     
+    _CLOSE = object()  # Record queue sentinel that stops the writer thread
+    
     def __init__(self, db_path: str = None):
         """Initialize database manager with optional custom path"""
         if db_path is None:
@@ -274,25 +592,139 @@ class DatabaseManager:
             self.db_path = db_path
             self.db_folder = os.path.dirname(db_path)
         
-        self.lock = threading.Lock()
+        self.lock = threading.Lock()  # Serializes writers on _write_conn
+        self._write_conn: Optional[sqlite3.Connection] = None
+        # save_record()/save_records_batch() only enqueue; one thread inserts
+        self._record_queue: queue.Queue = queue.Queue(maxsize=Config.DB_WRITE_QUEUE_SIZE)
+        # Coalesced update_village_progress() calls:
+        # (session_id, village_code) -> [last_survey, records_delta, matches_delta]
+        self._progress_lock = threading.Lock()
+        self._pending_progress: Dict[Tuple[str, str], List[int]] = {}
+        self._progress_updates = 0
+        self._progress_flushed_at = time.monotonic()
+        self._local = threading.local()  # Holds each thread's read connection
+        self.fts_enabled = False  # Set by _init_owner_search_index()
+        self._records_count: Optional[Tuple[float, int]] = None  # (fetched_at, count)
         self._init_database()
+        self._record_writer = threading.Thread(
+            target=self._record_writer_loop, name='db-record-writer', daemon=True
+        )
+        self._record_writer.start()
+        atexit.register(self.close)
         logger.info(f"📁 Database initialized: {self.db_path}")
     
+    @staticmethod
+    def _apply_pragmas(conn):
+        """Per-connection tuning (journal_mode=WAL is persistent, set by _writer)"""
+        conn.execute("PRAGMA synchronous=NORMAL")  # Balance between safety and speed
+        conn.execute("PRAGMA temp_store=MEMORY")  # Sorts/temp B-trees stay off disk
+        conn.execute("PRAGMA mmap_size=268435456")  # Read hot pages via a 256 MB memory map
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MB page cache
+    
     @contextmanager
     def get_connection(self):
-        """Thread-safe database connection context manager"""
-        conn = sqlite3.connect(self.db_path, timeout=30)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging for better concurrency
-        conn.execute("PRAGMA synchronous=NORMAL")  # Balance between safety and speed
+        """
+        Write transaction on the manager's long-lived connection.
+        
+        Callers hold self.lock, which already serializes every writer, so a
+        single connection (opened and tuned once) is shared between threads
+        instead of connecting and re-running pragmas for every statement.
+        Readers never take the lock (see read_connection()).
+        
+        Each transaction starts with BEGIN IMMEDIATE, taking SQLite's write
+        lock up front: another process holding it makes us wait out the busy
+        timeout here rather than fail mid-transaction on a lock upgrade.
+        Commits on success, rolls back on error; the connection stays open.
+        """
+        conn = self._writer()
+        conn.execute("BEGIN IMMEDIATE")
         try:
             yield conn
-            conn.commit()
-        except Exception as e:
-            conn.rollback()
-            raise e
-        finally:
-            conn.close()
+            conn.execute("COMMIT")
+        except Exception:
+            # SQLite may already have rolled back (e.g. a failed COMMIT); a
+            # second ROLLBACK would raise and hide the error that got us here
+            if conn.in_transaction:
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error as rollback_error:
+                    logger.warning(f"Rollback failed: {rollback_error}")
+            raise
+    
+    def _writer(self) -> sqlite3.Connection:
+        """The long-lived write connection, opened on first use (caller holds self.lock)"""
+        conn = self._write_conn
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False,
+                                   isolation_level=None,  # Transactions are explicit
+                                   cached_statements=256)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")  # Persistent; needs no open transaction
+            conn.execute(f"PRAGMA journal_size_limit={Config.DB_WAL_SIZE_LIMIT}")
+            self._apply_pragmas(conn)
+            self._write_conn = conn
+        return conn
+    
+    def checkpoint(self):
+        """
+        Copy the WAL back into the database file and truncate it.
+        
+        Called when a search ends, so the next search starts with an empty
+        WAL instead of appending to (and checkpointing) the last one's.
+        Readers in the middle of a query make this a partial checkpoint,
+        which is harmless.
+        """
+        self.flush()
+        self.flush_progress()
+        self._records_count = None
+        with self.lock:
+            try:
+                self._writer().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                logger.warning(f"WAL checkpoint failed: {e}")
+    
+    def close(self):
+        """Write queued records, then close the write connection and this thread's read connection"""
+        if self._record_writer.is_alive():
+            self._record_queue.put(self._CLOSE)
+            self._record_writer.join()
+        # Rows that raced with the sentinel
+        leftovers = []
+        while True:
+            try:
+                leftovers.extend(self._record_queue.get_nowait())
+            except queue.Empty:
+                break
+        if leftovers:
+            self._save_rows(leftovers)
+        if self._write_conn is not None:
+            self.flush_progress()
+        with self.lock:
+            if self._write_conn is not None:
+                self._write_conn.close()
+                self._write_conn = None
+        read_conn = getattr(self._local, 'read_conn', None)
+        if read_conn is not None:
+            read_conn.close()
+            self._local.read_conn = None
+    
+    @contextmanager
+    def read_connection(self):
+        """
+        Per-thread read-only connection for queries.
+        
+        Opened once per thread with mode=ro in autocommit, so each statement
+        reads the latest WAL snapshot without blocking (or being blocked by)
+        the writers that go through get_connection().
+        """
+        conn = getattr(self._local, 'read_conn', None)
+        if conn is None:
+            uri = Path(os.path.abspath(self.db_path)).as_uri() + '?mode=ro'
+            conn = sqlite3.connect(uri, uri=True, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._apply_pragmas(conn)
+            self._local.read_conn = conn
+        yield conn
     
     def _init_database(self):
         """Initialize database schema"""
@@ -373,10 +805,16 @@ class DatabaseManager:
                 ''')
                 
                 # Create indexes for fast lookups
+                # (session_id) also keeps each session's rows in id order for paging
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_session ON land_records(session_id)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_village ON land_records(village)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_owner ON land_records(owner_name)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_match ON land_records(is_match)')
+                # Per-session match listing/export: seek straight to a session's matches in id order
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_session_match ON land_records(session_id, is_match, id)')
+                # Per-session village/survey lookups
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_records_sv ON land_records(session_id, village, survey_no)')
+                # Nothing filters on village or is_match without a session
+                cursor.execute('DROP INDEX IF EXISTS idx_records_village')
+                cursor.execute('DROP INDEX IF EXISTS idx_records_match')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_progress_session ON village_progress(session_id)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_status ON search_sessions(status)')
                 
@@ -406,8 +844,56 @@ class DatabaseManager:
                         value TEXT
                     )
                 ''')
-                cursor.execute('INSERT OR REPLACE INTO db_meta (key, value) VALUES (?, ?)', 
-                              ('version', str(self.DB_VERSION)))
+                # Upsert in place (no delete + re-insert), and skip the write
+                # entirely when the stored version is already current
+                cursor.execute('''
+                    INSERT INTO db_meta (key, value) VALUES (?, ?)
+                    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                    WHERE value IS NOT excluded.value
+                ''', ('version', str(self.DB_VERSION)))
+                
+                self._init_owner_search_index(cursor)
+    
+    def _init_owner_search_index(self, cursor):
+        """
+        Trigram FTS5 index over land_records.owner_name, kept in sync by triggers.
+        
+        It lets search_records() answer LIKE '%name%' from the index instead of
+        scanning every record. Needs SQLite 3.34+ built with FTS5; without it the
+        plain LIKE scan is used.
+        """
+        try:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'land_records_fts'")
+            exists = cursor.fetchone() is not None
+            cursor.execute('''
+                CREATE VIRTUAL TABLE IF NOT EXISTS land_records_fts USING fts5(
+                    owner_name, content='land_records', content_rowid='id', tokenize='trigram'
+                )
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS land_records_fts_ai AFTER INSERT ON land_records BEGIN
+                    INSERT INTO land_records_fts(rowid, owner_name) VALUES (new.id, new.owner_name);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS land_records_fts_ad AFTER DELETE ON land_records BEGIN
+                    INSERT INTO land_records_fts(land_records_fts, rowid, owner_name)
+                    VALUES ('delete', old.id, old.owner_name);
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS land_records_fts_au AFTER UPDATE OF owner_name ON land_records BEGIN
+                    INSERT INTO land_records_fts(land_records_fts, rowid, owner_name)
+                    VALUES ('delete', old.id, old.owner_name);
+                    INSERT INTO land_records_fts(rowid, owner_name) VALUES (new.id, new.owner_name);
+                END
+            ''')
+            if not exists:
+                # Index records saved before the FTS table existed
+                cursor.execute("INSERT INTO land_records_fts(land_records_fts) VALUES ('rebuild')")
+            self.fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"⚠️ Owner search index unavailable, using LIKE scans: {e}")
     
     # ═══════════════════════════════════════════════════════════════════════════════════
     # SESSION MANAGEMENT
@@ -431,7 +917,7 @@ class DatabaseManager:
                 ''', (
                     session_id,
                     params.get('owner_name', ''),
-                    json.dumps(params.get('owner_variants', [])),
+                    dumps_json(params.get('owner_variants', [])).decode('utf-8'),
                     params.get('district_code', ''),
                     params.get('district_name', ''),
                     params.get('taluk_code', ''),
@@ -471,36 +957,59 @@ class DatabaseManager:
     
     def get_session(self, session_id: str) -> Optional[dict]:
         """Get session details"""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT * FROM search_sessions WHERE session_id = ?', (session_id,))
             row = cursor.fetchone()
             return dict(row) if row else None
     
     def get_recent_sessions(self, limit: int = 20) -> List[dict]:
-        """Get recent search sessions"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM search_sessions 
-                ORDER BY started_at DESC 
-                LIMIT ?
+        """Get recent search sessions with live record/match counts (one query)"""
+        with self.read_connection() as conn:
+            # Counts come from idx_records_session_match alone (covering index)
+            sessions = _fetch_dicts(conn, '''
+                SELECT s.*,
+                    COUNT(r.id) as record_count,
+                    COALESCE(SUM(r.is_match), 0) as match_count
+                FROM (
+                    SELECT * FROM search_sessions 
+                    ORDER BY started_at DESC 
+                    LIMIT ?
+                ) s
+                LEFT JOIN land_records r ON r.session_id = s.session_id
+                GROUP BY s.id
+                ORDER BY s.started_at DESC
             ''', (limit,))
-            return [dict(row) for row in cursor.fetchall()]
+        for session in sessions:
+            session['total_records'] = session.pop('record_count')
+            session['total_matches'] = session.pop('match_count')
+        return sessions
     
     def get_resumable_sessions(self) -> List[dict]:
-        """Get sessions that can be resumed (running or crashed)"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT s.*, 
-                       (SELECT COUNT(*) FROM village_progress WHERE session_id = s.session_id AND status = 'pending') as pending_villages,
-                       (SELECT COUNT(*) FROM village_progress WHERE session_id = s.session_id AND status = 'completed') as done_villages
-                FROM search_sessions s
-                WHERE s.status IN ('running', 'crashed')
+        """Get sessions that can be resumed (running or crashed)
+
+        Village counts come from one grouped pass over village_progress
+        instead of two correlated COUNT subqueries per session.
+        """
+        with self.read_connection() as conn:
+            return _fetch_dicts(conn, '''
+                WITH resumable AS (
+                    SELECT * FROM search_sessions WHERE status IN ('running', 'crashed')
+                ), vp AS (
+                    SELECT session_id,
+                           SUM(status = 'pending') as pending_villages,
+                           SUM(status = 'completed') as done_villages
+                    FROM village_progress
+                    WHERE session_id IN (SELECT session_id FROM resumable)
+                    GROUP BY session_id
+                )
+                SELECT s.*,
+                       COALESCE(vp.pending_villages, 0) as pending_villages,
+                       COALESCE(vp.done_villages, 0) as done_villages
+                FROM resumable s
+                LEFT JOIN vp ON vp.session_id = s.session_id
                 ORDER BY s.started_at DESC
             ''')
-            return [dict(row) for row in cursor.fetchall()]
     
     # ═══════════════════════════════════════════════════════════════════════════════════
     # VILLAGE PROGRESS TRACKING
@@ -511,161 +1020,250 @@ class DatabaseManager:
         with self.lock:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                for village_code, village_name, hobli_code, hobli_name in villages:
-                    cursor.execute('''
-                        INSERT OR IGNORE INTO village_progress 
-                        (session_id, village_code, village_name, hobli_code, hobli_name)
-                        VALUES (?, ?, ?, ?, ?)
-                    ''', (session_id, village_code, village_name, hobli_code, hobli_name))
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO village_progress 
+                    (session_id, village_code, village_name, hobli_code, hobli_name)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [
+                    (session_id, village_code, village_name, hobli_code, hobli_name)
+                    for village_code, village_name, hobli_code, hobli_name in villages
+                ])
     
     def start_village(self, session_id: str, village_code: str, max_survey: int = 200):
         """Mark village as in_progress"""
         with self.lock:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET status = 'in_progress', started_at = CURRENT_TIMESTAMP, max_survey_no = ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (max_survey, session_id, village_code))
+                cursor.execute(_SQL_START_VILLAGE, (max_survey, session_id, village_code))
     
     def update_village_progress(self, session_id: str, village_code: str, last_survey: int, records: int = 0, matches: int = 0):
-        """Update village progress (call periodically during search)"""
+        """
+        Update village progress (call periodically during search).
+        
+        Buffered in memory and written by flush_progress() every
+        PROGRESS_FLUSH_UPDATES calls or PROGRESS_FLUSH_INTERVAL seconds,
+        so per-survey calls cost a dict update rather than a transaction.
+        """
+        with self._progress_lock:
+            pending = self._pending_progress.get((session_id, village_code))
+            if pending is None:
+                self._pending_progress[(session_id, village_code)] = [last_survey, records, matches]
+            else:
+                pending[0] = last_survey
+                pending[1] += records
+                pending[2] += matches
+            self._progress_updates += 1
+            due = (self._progress_updates >= Config.PROGRESS_FLUSH_UPDATES or
+                   time.monotonic() - self._progress_flushed_at >= Config.PROGRESS_FLUSH_INTERVAL)
+        if due:
+            self.flush_progress()
+    
+    def flush_progress(self):
+        """Write buffered village progress in one executemany"""
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, {}
+            self._progress_updates = 0
+            self._progress_flushed_at = time.monotonic()
+        if not pending:
+            return
+        
         with self.lock:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET last_survey_no = ?, records_found = records_found + ?, matches_found = matches_found + ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (last_survey, records, matches, session_id, village_code))
+                conn.executemany(_SQL_UPDATE_PROGRESS, [
+                    (last_survey, records, matches, session_id, village_code)
+                    for (session_id, village_code), (last_survey, records, matches) in pending.items()
+                ])
     
     def complete_village(self, session_id: str, village_code: str, records: int, matches: int):
         """Mark village as completed"""
+        self.flush_progress()
         with self.lock:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET status = 'completed', completed_at = CURRENT_TIMESTAMP,
-                        records_found = ?, matches_found = ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (records, matches, session_id, village_code))
+                cursor.execute(_SQL_COMPLETE_VILLAGE, (records, matches, session_id, village_code))
     
     def fail_village(self, session_id: str, village_code: str, error: str):
         """Mark village as failed"""
+        self.flush_progress()
         with self.lock:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE village_progress 
-                    SET status = 'failed', error_message = ?
-                    WHERE session_id = ? AND village_code = ?
-                ''', (error, session_id, village_code))
+                cursor.execute(_SQL_FAIL_VILLAGE, (error, session_id, village_code))
     
     def get_pending_villages(self, session_id: str) -> List[dict]:
         """Get villages that still need to be searched (for resume)"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+        with self.read_connection() as conn:
+            return _fetch_dicts(conn, '''
                 SELECT * FROM village_progress 
                 WHERE session_id = ? AND status IN ('pending', 'in_progress', 'failed')
                 ORDER BY id
             ''', (session_id,))
-            return [dict(row) for row in cursor.fetchall()]
     
     # ═══════════════════════════════════════════════════════════════════════════════════
     # RECORD MANAGEMENT (REAL-TIME SAVES)
     # ═══════════════════════════════════════════════════════════════════════════════════
     
-    def save_record(self, session_id: str, record: dict, is_match: bool = False) -> int:
-        """Save a single record immediately (thread-safe, real-time)"""
-        with self.lock:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO land_records (
-                        session_id, district, taluk, hobli, village,
-                        survey_no, surnoc, hissa, period,
-                        owner_name, extent, khatah, is_match, worker_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    session_id,
-                    record.get('district', ''),
-                    record.get('taluk', ''),
-                    record.get('hobli', ''),
-                    record.get('village', ''),
-                    record.get('survey_no', 0),
-                    record.get('surnoc', ''),
-                    record.get('hissa', ''),
-                    record.get('period', ''),
-                    record.get('owner_name', ''),
-                    record.get('extent', ''),
-                    record.get('khatah', ''),
-                    1 if is_match else 0,
-                    record.get('worker_id', 0)
-                ))
-                return cursor.lastrowid
+    @staticmethod
+    def _record_params(session_id: str, r: dict, is_match: bool) -> tuple:
+        """_SQL_INSERT_RECORD parameters for one record dict"""
+        get = r.get
+        return (
+            session_id,
+            get('district', ''),
+            get('taluk', ''),
+            get('hobli', ''),
+            get('village', ''),
+            get('survey_no', 0),
+            get('surnoc', ''),
+            get('hissa', ''),
+            get('period', ''),
+            get('owner_name', ''),
+            get('extent', ''),
+            get('khatah', ''),
+            1 if is_match else 0,
+            get('worker_id', 0)
+        )
+    
+    def save_record(self, session_id: str, record: dict, is_match: bool = False):
+        """Queue a single record for the background record writer (see flush())"""
+        self._enqueue_rows([self._record_params(session_id, record, is_match)])
     
     def save_records_batch(self, session_id: str, records: List[dict], matches: List[bool] = None):
-        """Save multiple records in a single transaction (faster for batch)"""
+        """Queue multiple records; the writer inserts them with one executemany"""
         if not records:
             return
         
         if matches is None:
-            matches = [False] * len(records)
-        
+            matches = itertools.repeat(False)
+        
+        # Built eagerly: the rows outlive this call in the writer's queue
+        record_params = self._record_params
+        self._enqueue_rows([
+            record_params(session_id, r, is_match)
+            for r, is_match in zip(records, matches)
+        ])
+    
+    def _enqueue_rows(self, rows: List[tuple]):
+        """Hand rows to the writer thread, or insert them directly once it has stopped"""
+        if self._record_writer.is_alive():
+            self._record_queue.put(rows)
+        else:
+            self._insert_rows(rows)
+    
+    def _insert_rows(self, rows: List[tuple]):
+        """Insert record rows in one transaction"""
         with self.lock:
             with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany('''
-                    INSERT INTO land_records (
-                        session_id, district, taluk, hobli, village,
-                        survey_no, surnoc, hissa, period,
-                        owner_name, extent, khatah, is_match, worker_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', [
-                    (
-                        session_id,
-                        r.get('district', ''),
-                        r.get('taluk', ''),
-                        r.get('hobli', ''),
-                        r.get('village', ''),
-                        r.get('survey_no', 0),
-                        r.get('surnoc', ''),
-                        r.get('hissa', ''),
-                        r.get('period', ''),
-                        r.get('owner_name', ''),
-                        r.get('extent', ''),
-                        r.get('khatah', ''),
-                        1 if matches[i] else 0,
-                        r.get('worker_id', 0)
-                    )
-                    for i, r in enumerate(records)
-                ])
+                conn.executemany(_SQL_INSERT_RECORD, rows)
     
-    def get_session_records(self, session_id: str, limit: int = None, matches_only: bool = False) -> List[dict]:
-        """Get records for a session"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
+    def _save_rows(self, rows: List[tuple]):
+        """
+        Insert a writer batch without letting one failure discard all of it.
+        
+        A batch merges several workers' queued chunks. While the database is
+        locked or busy the whole batch is retried with a capped backoff, since
+        every row would fail the same way. Errors tied to particular rows
+        (constraints, bad values or bindings) fall back to row-by-row inserts,
+        so only the rows that fail on their own are lost and counted in the log.
+        """
+        delay = Config.DB_WRITE_RETRY_DELAY
+        while True:
+            try:
+                self._insert_rows(rows)
+                return
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if 'locked' not in message and 'busy' not in message:
+                    logger.error(f"Failed to save {len(rows)} records: {e}")
+                    return
+                logger.warning(f"Database busy saving {len(rows)} records, retrying in {delay:.1f}s: {e}")
+                time.sleep(delay)
+                delay = min(delay * 2, Config.DB_WRITE_RETRY_MAX_DELAY)
+            except (sqlite3.IntegrityError, sqlite3.DataError,
+                    sqlite3.ProgrammingError, sqlite3.InterfaceError) as e:
+                logger.warning(f"Saving {len(rows)} records failed, retrying row by row: {e}")
+                break
+            except Exception as e:
+                logger.error(f"Failed to save {len(rows)} records: {e}")
+                return
+        
+        failed = 0
+        for row in rows:
+            try:
+                self._insert_rows([row])
+            except Exception as e:
+                failed += 1
+                last_error = e
+        if failed:
+            logger.error(f"Failed to save {failed} of {len(rows)} records: {last_error}")
+    
+    def _record_writer_loop(self):
+        """
+        Background writer: drain queued record rows in batches of up to
+        DB_WRITE_BATCH_ROWS, one executemany and one commit per batch.
+        """
+        while True:
+            item = self._record_queue.get()
+            items = 1
+            stop = item is self._CLOSE
+            rows = [] if stop else item  # Queued lists are ours to extend
+            while not stop and len(rows) < Config.DB_WRITE_BATCH_ROWS:
+                try:
+                    item = self._record_queue.get_nowait()
+                except queue.Empty:
+                    break
+                items += 1
+                if item is self._CLOSE:
+                    stop = True
+                else:
+                    rows.extend(item)
+            
+            if rows:
+                self._save_rows(rows)
+            for _ in range(items):
+                self._record_queue.task_done()
+            if stop:
+                return
+    
+    def flush(self):
+        """Block until every queued record has been written"""
+        if self._record_writer.is_alive():
+            self._record_queue.join()
+    
+    def get_session_records(self, session_id: str, limit: int = None, matches_only: bool = False,
+                            after_id: int = None, before_id: int = None) -> List[dict]:
+        """
+        Get records for a session, newest first.
+        
+        Pages are keyset-based: pass the last id of the previous page as
+        before_id (newest-first) or after_id (switches to oldest-first), so
+        each page is an index seek rather than an OFFSET scan.
+        """
+        with self.read_connection() as conn:
             query = 'SELECT * FROM land_records WHERE session_id = ?'
             params = [session_id]
             
             if matches_only:
                 query += ' AND is_match = 1'
             
-            query += ' ORDER BY id DESC'
+            if after_id is not None:
+                query += ' AND id > ? ORDER BY id ASC'
+                params.append(after_id)
+            elif before_id is not None:
+                query += ' AND id < ? ORDER BY id DESC'
+                params.append(before_id)
+            else:
+                query += ' ORDER BY id DESC'
             
             if limit:
                 query += ' LIMIT ?'
                 params.append(limit)
             
-            cursor.execute(query, params)
-            return [dict(row) for row in cursor.fetchall()]
+            return _fetch_dicts(conn, query, params)
     
     def get_session_stats(self, session_id: str) -> dict:
         """Get statistics for a session"""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -683,34 +1281,108 @@ class DatabaseManager:
                 'villages_with_records': row['villages_with_records'] or 0
             }
     
+    def get_session_with_stats(self, session_id: str) -> Optional[dict]:
+        """Get session details merged with get_session_stats() in one query"""
+        with self.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT s.*,
+                    st.record_count, st.match_count, st.village_count
+                FROM search_sessions s
+                CROSS JOIN (
+                    SELECT 
+                        COUNT(*) as record_count,
+                        SUM(is_match) as match_count,
+                        COUNT(DISTINCT village) as village_count
+                    FROM land_records WHERE session_id = ?
+                ) st
+                WHERE s.session_id = ?
+            ''', (session_id, session_id))
+            
+            row = cursor.fetchone()
+            if not row:
+                return None
+            session = dict(row)
+            # Live counts from land_records win over the session row's counters
+            session['total_records'] = session.pop('record_count') or 0
+            session['total_matches'] = session.pop('match_count') or 0
+            session['villages_with_records'] = session.pop('village_count') or 0
+            return session
+    
     # ═══════════════════════════════════════════════════════════════════════════════════
     # EXPORT FUNCTIONS
     # ═══════════════════════════════════════════════════════════════════════════════════
     
-    def export_to_csv(self, session_id: str, output_path: str, matches_only: bool = False) -> str:
-        """Export session records to CSV file"""
-        records = self.get_session_records(session_id, matches_only=matches_only)
-        
-        if not records:
-            return None
+    EXPORT_FIELDNAMES = ['district', 'taluk', 'hobli', 'village', 'survey_no', 
+                         'surnoc', 'hissa', 'period', 'owner_name', 'extent', 'khatah', 'created_at']
+    
+    def iter_session_batches(self, session_id: str, matches_only: bool = False, batch_size: int = 1000):
+        """Yield a session's export rows (newest first) as lists of up to batch_size
+        tuples in EXPORT_FIELDNAMES order.
         
-        fieldnames = ['district', 'taluk', 'hobli', 'village', 'survey_no', 
-                      'surnoc', 'hissa', 'period', 'owner_name', 'extent', 'khatah', 'created_at']
+        Rows are fetched batch_size at a time, so memory stays flat however
+        large the session is. The connection is held until the generator is
+        exhausted or closed.
+        """
+        query = f"SELECT {', '.join(self.EXPORT_FIELDNAMES)} FROM land_records WHERE session_id = ?"
+        if matches_only:
+            query += ' AND is_match = 1'
+        query += ' ORDER BY id DESC'
         
-        with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(records)
+        with self.read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # fetchmany() then returns ready-made tuples
+            cursor.execute(query, (session_id,))
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield rows
+    
+    def iter_session_rows(self, session_id: str, matches_only: bool = False, batch_size: int = 1000):
+        """Yield a session's export rows one tuple at a time (see iter_session_batches)"""
+        for batch in self.iter_session_batches(session_id, matches_only, batch_size):
+            yield from batch
+    
+    def export_to_csv(self, session_id: str, output_path: str, matches_only: bool = False) -> str:
+        """
+        Export session records to CSV file.
         
-        logger.info(f"📁 Exported {len(records)} records to {output_path}")
+        Streams from SQLite a batch at a time (one writerows per fetchmany);
+        the session is never held in memory as a whole.
+        """
+        batches = self.iter_session_batches(session_id, matches_only)
+        first = next(batches, None)
+        count = 0
+        if first is not None:
+            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(self.EXPORT_FIELDNAMES)
+                for batch in itertools.chain((first,), batches):
+                    writer.writerows(batch)
+                    count += len(batch)
+        
+        if not count:
+            return None
+        logger.info(f"📁 Exported {count} records to {output_path}")
         return output_path
     
     def get_all_records_count(self) -> int:
-        """Get total records across all sessions"""
-        with self.get_connection() as conn:
+        """
+        Get total records across all sessions.
+        
+        COUNT(*) walks a whole index, so the result is reused for
+        RECORD_COUNT_TTL seconds; checkpoint() drops it when a search ends.
+        """
+        cached = self._records_count
+        if cached is not None and time.monotonic() - cached[0] < Config.RECORD_COUNT_TTL:
+            return cached[1]
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM land_records')
-            return cursor.fetchone()[0]
+            count = cursor.fetchone()[0]
+        self._records_count = (time.monotonic(), count)
+        return count
     
     # ═══════════════════════════════════════════════════════════════════════════════════
     # ACCURACY TRACKING - Skipped Items for Retry
@@ -730,18 +1402,16 @@ class DatabaseManager:
     
     def get_skipped_items(self, session_id: str) -> List[dict]:
         """Get all skipped items for a session"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+        with self.read_connection() as conn:
+            return _fetch_dicts(conn, '''
                 SELECT * FROM skipped_items 
                 WHERE session_id = ? AND status = 'pending'
                 ORDER BY id
             ''', (session_id,))
-            return [dict(row) for row in cursor.fetchall()]
     
     def get_skipped_count(self, session_id: str) -> int:
         """Get count of skipped items for a session"""
-        with self.get_connection() as conn:
+        with self.read_connection() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT COUNT(*) FROM skipped_items 
@@ -751,17 +1421,21 @@ class DatabaseManager:
     
     def search_records(self, owner_name: str, limit: int = 100) -> List[dict]:
         """Search records by owner name across all sessions"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
+        # The trigram index needs at least 3 characters to narrow anything down
+        if self.fts_enabled and len(owner_name) >= 3:
+            match_clause = 'r.id IN (SELECT rowid FROM land_records_fts WHERE owner_name LIKE ?)'
+        else:
+            match_clause = 'r.owner_name LIKE ?'
+        
+        with self.read_connection() as conn:
+            return _fetch_dicts(conn, f'''
                 SELECT r.*, s.owner_name as search_owner, s.started_at as search_date
                 FROM land_records r
                 JOIN search_sessions s ON r.session_id = s.session_id
-                WHERE r.owner_name LIKE ?
+                WHERE {match_clause}
                 ORDER BY r.created_at DESC
                 LIMIT ?
             ''', (f'%{owner_name}%', limit))
-            return [dict(row) for row in cursor.fetchall()]
 
 
 # Global database instance
@@ -784,21 +1458,50 @@ class BhoomiAPI:
     
     def __init__(self):
         self.session = requests.Session()
+        # Keep-alive pool sized for concurrent location lookups (UI prefetch
+        # plus server threads); retry idempotent calls on transient failures
+        adapter = HTTPAdapter(
+            pool_connections=Config.API_POOL_CONNECTIONS,
+            pool_maxsize=Config.API_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'application/json, text/javascript, */*; q=0.01',
             'Content-Type': 'application/json; charset=utf-8',
         })
-        self._cache = {}
+        # (endpoint, *sorted data items) -> (fetched_at, result), oldest-used first
+        self._cache: 'OrderedDict[tuple, Tuple[float, Any]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    def warm_up(self):
+        """Open a pooled connection to the portal (DNS + TLS) ahead of the first lookup"""
+        try:
+            self.session.head(Config.ECHAWADI_BASE, verify=False, timeout=5)
+        except requests.RequestException as e:
+            logger.warning(f"Portal warm-up failed: {e}")
+    
+    def clear_cache(self) -> int:
+        """Drop all cached lookups, returns how many were dropped"""
+        with self._cache_lock:
+            count = len(self._cache)
+            self._cache.clear()
+        return count
     
     def _make_request(self, endpoint: str, data: dict = None, method: str = 'POST') -> Optional[dict]:
         """Make API request with error handling"""
         url = f"{Config.ECHAWADI_BASE}/{endpoint}"
-        cache_key = f"{endpoint}:{json.dumps(data, sort_keys=True)}"
+        # Request payloads are flat str -> str dicts, so their items hash directly
+        cache_key = (endpoint, *sorted(data.items())) if data else (endpoint,)
         
-        # Check cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        # Check cache (TTL + LRU)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached and time.time() - cached[0] < Config.API_CACHE_TTL:
+                self._cache.move_to_end(cache_key)
+                return cached[1]
         
         try:
             if method == 'GET':
@@ -809,12 +1512,16 @@ class BhoomiAPI:
             result = response.text
             # Handle double-encoded JSON
             if result.startswith('"') and result.endswith('"'):
-                result = json.loads(result)
+                result = loads_json(result)
             if isinstance(result, str):
-                result = json.loads(result)
+                result = loads_json(result)
             
             # Cache result
-            self._cache[cache_key] = result
+            with self._cache_lock:
+                self._cache[cache_key] = (time.time(), result)
+                self._cache.move_to_end(cache_key)
+                while len(self._cache) > Config.API_CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
             return result
             
         except Exception as e:
@@ -856,6 +1563,61 @@ class BhoomiAPI:
 # SEARCH WORKER
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
+# Run of capitals left when a district dropdown's options are flattened into a row
+_DISTRICT_RUN_RE = re.compile(r'[A-Z]{5,}[A-Z]{5,}')
+
+# Portal messages that mean the session is gone. One case-insensitive scan of
+# the page source, instead of lower()-copying it and testing each phrase.
+_SESSION_EXPIRED_RE = re.compile('|'.join(map(re.escape, [
+    'session expired',
+    'please login again',
+    'session timeout',
+    'your session has expired',
+    'login again',
+    'session has been terminated',
+])), re.IGNORECASE)
+
+def _compile_owner_matcher(variants: List[str]):
+    """
+    One case-insensitive regex alternation over the owner-name variants, so
+    matching a name is a single scan instead of one substring test (and one
+    lower() of the name) per variant. None when there is nothing to match.
+    """
+    variants = sorted({v for v in variants if v}, key=len, reverse=True)
+    if not variants:
+        return None
+    return re.compile('|'.join(map(re.escape, variants)), re.IGNORECASE)
+
+def _option_texts(select) -> List[str]:
+    """
+    Visible texts of a dropdown's real options (skipping 'Select ...').
+    
+    Each option's text is read once (every read is a WebDriver round trip)
+    and interned: surnoc/hissa/period values repeat across every survey, so
+    the records built from them share one string object per value.
+    """
+    texts = (option.text for option in select.options)
+    return [sys.intern(text) for text in texts if "Select" not in text]
+
+_chromedriver_path: Optional[str] = None
+_chromedriver_lock = threading.Lock()
+
+def _get_chromedriver_path() -> str:
+    """
+    Resolve the chromedriver binary once per process.
+    
+    ChromeDriverManager().install() checks its cache and usually the
+    network for the matching driver version; every worker (and the
+    village-list browser) needs the same binary, so later callers reuse
+    the first result. A failed install is not cached and is retried.
+    """
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
 class SearchWorker:
     """
     Individual search worker that runs in its own thread with its own browser.
@@ -898,6 +1660,55 @@ class SearchWorker:
         self.records_found = 0
         self.matches_found = 0
         self.errors = 0
+        
+        # Records awaiting a batched DB/CSV write (see _flush_records); the
+        # lock lets the coordinator flush them from a request thread
+        self._pending_lock = threading.Lock()
+        self._pending_records: List[Dict[str, Any]] = []
+        self._pending_matches: List[bool] = []
+        self._pending_since = 0.0
+    
+    def _buffer_record(self, record: Dict[str, Any], is_match: bool):
+        """Queue a record for the next batched write"""
+        with self._pending_lock:
+            if not self._pending_records:
+                self._pending_since = time.monotonic()
+            self._pending_records.append(record)
+            self._pending_matches.append(is_match)
+            due = (len(self._pending_records) >= Config.WORKER_FLUSH_ROWS or
+                   time.monotonic() - self._pending_since >= Config.WORKER_FLUSH_INTERVAL)
+        if due:
+            self._flush_records()
+    
+    def _flush_if_stale(self):
+        """
+        Flush buffered records once the oldest has waited WORKER_FLUSH_INTERVAL.
+        
+        Called at every survey boundary, so sparse villages (where the next
+        record, which would normally trigger the check, may be many surveys
+        away) don't keep rows out of the CSV backups and database.
+        """
+        if self._pending_records and time.monotonic() - self._pending_since >= Config.WORKER_FLUSH_INTERVAL:
+            self._flush_records()
+    
+    def _flush_records(self):
+        """Write buffered records to the CSV backups and the database in one batch each"""
+        with self._pending_lock:
+            if not self._pending_records:
+                return
+            records, matches = self._pending_records, self._pending_matches
+            self._pending_records, self._pending_matches = [], []
+        
+        self.all_records_writer.write_records(records)
+        matched = [record for record, is_match in zip(records, matches) if is_match]
+        if matched:
+            self.matches_writer.write_records(matched)
+        
+        if self.db and self.session_id:
+            try:
+                self.db.save_records_batch(self.session_id, records, matches)
+            except Exception as e:
+                self.logger.error(f"Failed to save {len(records)} records to database: {e}")
     
     def _update_status(self, **kwargs):
         """Thread-safe status update"""
@@ -907,16 +1718,13 @@ class SearchWorker:
                 for key, value in kwargs.items():
                     if hasattr(worker_status, key):
                         setattr(worker_status, key, value)
-                worker_status.last_update = datetime.now().isoformat()
+                worker_status.last_update = _now_iso()
     
     def _add_log(self, message: str):
         """Thread-safe log addition"""
         with self.state_lock:
             log_entry = f"[W{self.worker_id}] {message}"
-            self.state.logs.append(log_entry)
-            # Keep only last 100 logs
-            if len(self.state.logs) > 100:
-                self.state.logs = self.state.logs[-100:]
+            self.state.add_log(log_entry)
         self.logger.info(message)
     
     def _update_global_stats(self):
@@ -947,7 +1755,6 @@ class SearchWorker:
         from selenium import webdriver
         from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
         
         # Clean user data directory for this worker
         user_data_dir = os.path.join(tempfile.gettempdir(), f'bhoomi_chrome_{self.worker_id}')
@@ -987,7 +1794,7 @@ class SearchWorker:
                 # Page load strategy - don't wait for all resources
                 options.page_load_strategy = 'eager'
                 
-                service = Service(ChromeDriverManager().install())
+                service = Service(_get_chromedriver_path())
                 self.driver = webdriver.Chrome(service=service, options=options)
                 self.driver.set_page_load_timeout(Config.PAGE_LOAD_TIMEOUT)
                 
@@ -1028,14 +1835,70 @@ class SearchWorker:
         # Clean up user data directory
         user_data_dir = os.path.join(tempfile.gettempdir(), f'chrome_worker_{self.worker_id}_{os.getpid()}')
     
-    def _handle_alert(self) -> tuple:
+    def _select_and_wait(self, key: str, value: str, next_key: str = None):
         """
-        Handle any JavaScript alert that might be blocking the page.
-        Returns (had_alert: bool, alert_text: str, is_portal_issue: bool)
+        Select value in the IDS[key] dropdown.
         
-        For 100% accuracy, we detect portal issues and retry instead of failing.
+        With next_key, returns as soon as the postback has filled that
+        dropdown (more than its 'Select ...' placeholder), polling every
+        DROPDOWN_POLL_INTERVAL, instead of sleeping a fixed POST_SELECT_WAIT.
+        If it never fills within ELEMENT_WAIT_TIMEOUT we carry on, just as
+        the fixed sleep did. Without next_key the fixed sleep is kept.
         """
-        try:
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import Select, WebDriverWait
+        from selenium.common.exceptions import (
+            NoSuchElementException, StaleElementReferenceException, TimeoutException
+        )
+        
+        IDS = Config.ELEMENT_IDS
+        Select(self.driver.find_element(By.ID, IDS[key])).select_by_value(value)
+        if next_key is None:
+            time.sleep(Config.POST_SELECT_WAIT)
+            return
+        
+        options_css = f"#{IDS[next_key]} option"
+        try:
+            WebDriverWait(
+                self.driver, Config.ELEMENT_WAIT_TIMEOUT,
+                poll_frequency=Config.DROPDOWN_POLL_INTERVAL,
+                ignored_exceptions=(NoSuchElementException, StaleElementReferenceException)
+            ).until(lambda d: len(d.find_elements(By.CSS_SELECTOR, options_css)) > 1)
+        except TimeoutException:
+            pass
+    
+    def _wait_for_stale(self, element) -> bool:
+        """True once element has been detached by a postback (within ELEMENT_WAIT_TIMEOUT)"""
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            WebDriverWait(
+                self.driver, Config.ELEMENT_WAIT_TIMEOUT,
+                poll_frequency=Config.DROPDOWN_POLL_INTERVAL
+            ).until(EC.staleness_of(element))
+            return True
+        except TimeoutException:
+            return False
+    
+    def _select_location(self, village_code: str, hobli_code: str):
+        """Select district -> taluk -> hobli -> village on a freshly loaded service2 form"""
+        self._select_and_wait('district', self.params['district_code'], 'taluk')
+        self._select_and_wait('taluk', self.params['taluk_code'], 'hobli')
+        self._select_and_wait('hobli', hobli_code, 'village')
+        # Nothing cascades from the village; keep the fixed settle time so
+        # its postback finishes before the survey number is typed
+        self._select_and_wait('village', village_code)
+    
+    def _handle_alert(self) -> tuple:
+        """
+        Handle any JavaScript alert that might be blocking the page.
+        Returns (had_alert: bool, alert_text: str, is_portal_issue: bool)
+        
+        For 100% accuracy, we detect portal issues and retry instead of failing.
+        """
+        try:
             from selenium.webdriver.common.alert import Alert
             from selenium.webdriver.support.ui import WebDriverWait
             from selenium.webdriver.support import expected_conditions as EC
@@ -1128,21 +1991,7 @@ class SearchWorker:
                 page_source = self.driver.page_source
             
             # Check for session expiry messages
-            session_expired_indicators = [
-                'session expired',
-                'please login again',
-                'session timeout',
-                'your session has expired',
-                'login again',
-                'session has been terminated',
-            ]
-            
-            page_lower = page_source.lower()
-            for indicator in session_expired_indicators:
-                if indicator in page_lower:
-                    return True
-            
-            return False
+            return _SESSION_EXPIRED_RE.search(page_source) is not None
         except Exception as e:
             self.logger.error(f"Session check error: {e}")
             # Handle the case where error is due to alert
@@ -1183,11 +2032,11 @@ class SearchWorker:
         FIXED: Now correctly filters out form elements and dropdowns.
         """
         from bs4 import BeautifulSoup
-        import re
         
         owners = []
+        seen = set()
         try:
-            soup = BeautifulSoup(page_source, 'html.parser')
+            soup = BeautifulSoup(page_source, HTML_PARSER)
             
             # CRITICAL FIX: Exclude form elements and dropdowns
             # Remove all select dropdowns, form elements, and navigation before parsing
@@ -1196,27 +2045,25 @@ class SearchWorker:
             
             # Strategy 1: Look for the RESULTS table (not the form table)
             results_table = None
+            # Checks run cheapest first; re-serializing a table to HTML is
+            # only done for the few that pass the text checks
             for table in soup.find_all('table'):
                 table_text = table.get_text()
-                table_html = str(table)
                 
                 # MUST have owner/extent keywords
-                has_owner_keywords = any(kw in table_text for kw in ['Owner', 'ಮಾಲೀಕರ', 'Extent', 'ವಿಸ್ತೀರ್ಣ', 'Khata', 'ಖಾತಾ'])
+                if not any(kw in table_text for kw in Config.OWNER_TABLE_KEYWORDS):
+                    continue
                 
                 # MUST NOT have form keywords (this filters out the search form table)
-                has_form_keywords = any(kw in table_text for kw in [
-                    'Select District', 'Select Taluk', 'Select Hobli', 'Select Village',
-                    'Select Survey', 'Select Surnoc', 'Select Hissa', 'Select Period',
-                    'Toggle navigation'
-                ])
+                if any(kw in table_text for kw in Config.FORM_TABLE_KEYWORDS):
+                    continue
                 
                 # MUST NOT contain select tags (double-check)
-                has_select_tags = 'select' in table_html.lower()
+                if 'select' in str(table).lower():
+                    continue
                 
                 # MUST have reasonable number of rows (results table has multiple rows)
-                num_rows = len(table.find_all('tr'))
-                
-                if has_owner_keywords and not has_form_keywords and not has_select_tags and num_rows >= 2:
+                if len(table.find_all('tr')) >= 2:
                     results_table = table
                     break
             
@@ -1224,51 +2071,45 @@ class SearchWorker:
                 self.logger.warning(f"No valid results table found in page")
                 return owners
             
-            # Extract from the validated results table only
+            # Extract from the validated results table only. Cheapest,
+            # most selective checks first: most rows fail on the name alone.
             rows = results_table.find_all('tr')
             for row in rows:
                 cells = row.find_all(['td', 'th'])
                 if len(cells) >= 2:
                     cell_texts = [c.get_text(strip=True) for c in cells]
+                    owner_name = cell_texts[0]
+                    
+                    # MUST have reasonable name length (not just numbers or single chars)
+                    if len(owner_name) < Config.MIN_OWNER_NAME_LENGTH or owner_name.isdigit():
+                        continue
+                    if 'Select' in owner_name:
+                        continue
+                    
                     row_text = ' '.join(cell_texts)
                     
                     # ADDITIONAL VALIDATION: Skip rows that look like form elements
                     # Check for dropdown-style text patterns
-                    is_dropdown_option = any(pattern in row_text for pattern in [
-                        'Select ', 'Toggle ', 'District', 'Taluk', 'Hobli', 'Village',
-                        'Survey Number', 'Surnoc', 'Hissa', 'Period', 'Year'
-                    ])
+                    if any(pattern in row_text for pattern in Config.OWNER_ROW_SKIP_PATTERNS):
+                        continue
                     
                     # Check for suspicious patterns (all caps district names in sequence)
-                    is_district_list = re.search(r'[A-Z]{5,}[A-Z]{5,}', row_text.replace(' ', ''))
-                    
-                    if is_dropdown_option or is_district_list:
+                    if _DISTRICT_RUN_RE.search(row_text.replace(' ', '')):
                         continue  # Skip this row - it's form data!
                     
-                    # Multiple patterns to catch owner data
-                    # Pattern 1: Extent format like 0.12.0 or 1-2-3
-                    # Pattern 2: Rows with substantial text (likely names)
-                    has_extent = re.search(r'\d+[\.\-]\d+[\.\-]\d+', row_text)
-                    has_name = len(cell_texts[0]) > 2 and not cell_texts[0].isdigit()
-                    
                     # Skip header rows
-                    is_header = any(h in row_text.lower() for h in ['owner', 'extent', 'sl.no', 'slno', 'ಮಾಲೀಕರ', 'ಸ್ಥಿತಿ'])
+                    row_lower = row_text.lower()
+                    if any(h in row_lower for h in Config.OWNER_HEADER_KEYWORDS):
+                        continue
                     
-                    # MUST have reasonable name length (not just numbers or single chars)
-                    has_valid_name = len(cell_texts[0]) >= 3 and not cell_texts[0].isdigit()
+                    extent = cell_texts[1]
+                    khatah = cell_texts[2] if len(cell_texts) > 2 else ''
                     
-                    if (has_extent or has_name) and not is_header and has_valid_name:
-                        owner_entry = {
-                            'owner_name': cell_texts[0] if cell_texts else '',
-                            'extent': cell_texts[1] if len(cell_texts) > 1 else '',
-                            'khatah': cell_texts[2] if len(cell_texts) > 2 else '',
-                        }
-                        # Avoid duplicates and validate owner name is not form text
-                        if (owner_entry['owner_name'] and 
-                            owner_entry not in owners and
-                            'Select' not in owner_entry['owner_name'] and
-                            len(owner_entry['owner_name']) >= 3):
-                            owners.append(owner_entry)
+                    # Avoid duplicates
+                    key = (owner_name, extent, khatah)
+                    if key not in seen:
+                        seen.add(key)
+                        owners.append({'owner_name': owner_name, 'extent': extent, 'khatah': khatah})
             
             # Log extraction result for debugging
             if not owners:
@@ -1291,7 +2132,7 @@ class SearchWorker:
         
         IDS = Config.ELEMENT_IDS
         max_survey = self.params.get('max_survey', Config.DEFAULT_MAX_SURVEY)
-        owner_variants = self.state.owner_variants
+        owner_matcher = _compile_owner_matcher(self.state.owner_variants)
         
         district_name = self.params.get('district_name', 'Unknown')
         taluk_name = self.params.get('taluk_name', 'Unknown')
@@ -1307,6 +2148,10 @@ class SearchWorker:
         surveys_with_data = 0
         session_retries = 0  # Track session recovery attempts
         portal_retries = 0   # Track RTC access retries per survey (FIXED: prevent infinite loops)
+        # Set once a survey finishes cleanly: the next one reuses the loaded
+        # form (district..village stay selected) and only re-enters the survey
+        # number. Retry and error paths leave it False -> fresh page load.
+        form_ready = False
 
         self._add_log(f"🏘️ Starting {village_name}: Surveys 1 to {max_survey}")
         
@@ -1319,70 +2164,97 @@ class SearchWorker:
             
             surveys_checked += 1
             self._update_status(current_survey=survey_no)
+            self._flush_if_stale()
             
             # Log every 10th survey for better tracking
             if survey_no == 1 or survey_no % 10 == 0:
                 self._add_log(f"📍 {village_name}: Survey {survey_no}/{max_survey} (found {surveys_with_data})")
             
+            reuse_form, form_ready = form_ready, False
             try:
-                # Navigate to portal
-                self.driver.get(Config.SERVICE2_URL)
-                time.sleep(Config.POST_SELECT_WAIT)
+                if reuse_form:
+                    # Only reuse the page while our village is still the selected one
+                    try:
+                        village_sel = Select(self.driver.find_element(By.ID, IDS['village']))
+                        reuse_form = village_sel.first_selected_option.get_attribute('value') == village_code
+                    except Exception:
+                        reuse_form = False
                 
-                # ═══════════════════════════════════════════════════════════════════════
-                # SESSION EXPIRATION CHECK #1 - After loading portal
-                # ═══════════════════════════════════════════════════════════════════════
-                if self._is_session_expired():
-                    self._add_log(f"⚠️ Session expired at {village_name} survey {survey_no}")
-                    if session_retries < Config.MAX_SESSION_RETRIES:
-                        session_retries += 1
-                        self._add_log(f"🔄 Retry {session_retries}/{Config.MAX_SESSION_RETRIES} - refreshing session...")
-                        if self._refresh_session():
-                            continue  # RETRY same survey, don't increment
+                if not reuse_form:
+                    # Navigate to portal
+                    self.driver.get(Config.SERVICE2_URL)
+                    time.sleep(Config.POST_SELECT_WAIT)
+                    
+                    # ═══════════════════════════════════════════════════════════════════════
+                    # SESSION EXPIRATION CHECK #1 - After loading portal
+                    # ═══════════════════════════════════════════════════════════════════════
+                    if self._is_session_expired():
+                        self._add_log(f"⚠️ Session expired at {village_name} survey {survey_no}")
+                        if session_retries < Config.MAX_SESSION_RETRIES:
+                            session_retries += 1
+                            self._add_log(f"🔄 Retry {session_retries}/{Config.MAX_SESSION_RETRIES} - refreshing session...")
+                            if self._refresh_session():
+                                continue  # RETRY same survey, don't increment
+                            else:
+                                # Refresh failed, try restarting browser
+                                self._add_log(f"⚠️ Session refresh failed, restarting browser...")
+                                self._close_browser()
+                                time.sleep(2)
+                                self._init_browser()
+                                continue  # RETRY same survey
                         else:
-                            # Refresh failed, try restarting browser
-                            self._add_log(f"⚠️ Session refresh failed, restarting browser...")
-                            self._close_browser()
-                            time.sleep(2)
-                            self._init_browser()
-                            continue  # RETRY same survey
-                    else:
-                        self._add_log(f"❌ Max session retries reached for {village_name}")
-                        raise Exception(f"Session expired {session_retries} times for {village_name}")
-                
-                # Reset session retries on successful page load
-                session_retries = 0
-                
-                # Select location (fast sequence)
-                Select(self.driver.find_element(By.ID, IDS['district'])).select_by_value(self.params['district_code'])
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                Select(self.driver.find_element(By.ID, IDS['taluk'])).select_by_value(self.params['taluk_code'])
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                Select(self.driver.find_element(By.ID, IDS['hobli'])).select_by_value(hobli_code)
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                Select(self.driver.find_element(By.ID, IDS['village'])).select_by_value(village_code)
-                time.sleep(Config.POST_SELECT_WAIT)
-                
-                # Enter survey number
-                survey_input = self.driver.find_element(By.ID, IDS['survey_no'])
-                survey_input.clear()
-                survey_input.send_keys(str(survey_no))
-                
-                # Click GO using JavaScript
-                go_btn = self.driver.find_element(By.ID, IDS['go_btn'])
-                self.driver.execute_script("arguments[0].click();", go_btn)
-                time.sleep(Config.POST_CLICK_WAIT)
-                
-                # ═══════════════════════════════════════════════════════════════════════
-                # PORTAL ISSUE & SESSION CHECK - After clicking GO
-                # For 100% accuracy: Handle alerts and portal issues before proceeding
-                # ═══════════════════════════════════════════════════════════════════════
+                            self._add_log(f"❌ Max session retries reached for {village_name}")
+                            raise Exception(f"Session expired {session_retries} times for {village_name}")
+                    
+                    # Reset session retries on successful page load
+                    session_retries = 0
+                    
+                    # Select location (each step waits for the next dropdown to fill)
+                    self._select_location(village_code, hobli_code)
                 
-                # First, handle any portal alerts (e.g., "facing issues" messages)
-                had_alert, alert_text, is_portal_issue = self._handle_alert()
+                # Everything up to the stale check runs against a page left over
+                # from the previous survey when the form is reused; if any of it
+                # fails there, retry this survey on a fresh load, not skip it
+                alert_empty = False
+                try:
+                    # On a reused form the surnoc dropdown still holds the previous
+                    # survey's options; GO's postback must replace it before we read it
+                    old_surnoc = self.driver.find_element(By.ID, IDS['surnoc']) if reuse_form else None
+                    
+                    # Enter survey number
+                    survey_input = self.driver.find_element(By.ID, IDS['survey_no'])
+                    survey_input.clear()
+                    survey_input.send_keys(str(survey_no))
+                    
+                    # Click GO using JavaScript
+                    go_btn = self.driver.find_element(By.ID, IDS['go_btn'])
+                    self.driver.execute_script("arguments[0].click();", go_btn)
+                    time.sleep(Config.POST_CLICK_WAIT)
+                    
+                    # ═══════════════════════════════════════════════════════════════════════
+                    # PORTAL ISSUE & SESSION CHECK - After clicking GO
+                    # For 100% accuracy: Handle alerts and portal issues before proceeding
+                    # ═══════════════════════════════════════════════════════════════════════
+                    
+                    # First, handle any portal alerts (e.g., "facing issues" messages)
+                    had_alert, alert_text, is_portal_issue = self._handle_alert()
+                    
+                    if old_surnoc is not None and not is_portal_issue:
+                        if had_alert:
+                            # On a fresh page such an alert leaves surnoc empty; on
+                            # this one it still holds the last survey's options, so
+                            # record the same empty-survey outcome without reading them
+                            alert_empty = True
+                        elif not self._wait_for_stale(old_surnoc):
+                            # GO's postback never replaced the old surnoc: redo this
+                            # survey on a freshly loaded form instead
+                            self.logger.info(f"Form reuse failed at {village_name} Sy:{survey_no}, reloading")
+                            continue  # form_ready is False, so this survey reloads
+                except Exception as e:
+                    if not reuse_form:
+                        raise
+                    self.logger.info(f"Form reuse failed at {village_name} Sy:{survey_no} ({str(e)[:40]}), reloading")
+                    continue  # form_ready is False, so this survey reloads
                 
                 if is_portal_issue:
                     # FIXED: Don't loop forever! This alert is for THIS SPECIFIC survey/RTC
@@ -1410,8 +2282,11 @@ class SearchWorker:
                         raise Exception(f"Persistent session expiry for {village_name}")
                 
                 # Check if surnoc populated
-                surnoc_sel = Select(self.driver.find_element(By.ID, IDS['surnoc']))
-                surnoc_opts = [o.text for o in surnoc_sel.options if "Select" not in o.text]
+                if alert_empty:
+                    surnoc_opts = []
+                else:
+                    surnoc_sel = Select(self.driver.find_element(By.ID, IDS['surnoc']))
+                    surnoc_opts = _option_texts(surnoc_sel)
                 
                 if not surnoc_opts:
                     # This is a genuinely empty survey (not session expired)
@@ -1422,6 +2297,7 @@ class SearchWorker:
                         self._add_log(f"📊 {village_name} Summary: Checked {surveys_checked}, Found data in {surveys_with_data}")
                         break
                     survey_no += 1  # Move to next survey
+                    form_ready = True
                     continue
                 
                 # Found data - reset counters and increment found count
@@ -1441,7 +2317,7 @@ class SearchWorker:
                         
                         # Get hissa options
                         hissa_sel = Select(self.driver.find_element(By.ID, IDS['hissa']))
-                        hissa_opts = [o.text for o in hissa_sel.options if "Select" not in o.text]
+                        hissa_opts = _option_texts(hissa_sel)
                         
                         # Process each hissa
                         for hissa in hissa_opts:
@@ -1462,7 +2338,7 @@ class SearchWorker:
                                     # This reduces errors and speeds up processing significantly
                                     # ═══════════════════════════════════════════════════════════════════════
                                     period_sel = Select(self.driver.find_element(By.ID, IDS['period']))
-                                    period_opts = [o.text for o in period_sel.options if "Select" not in o.text]
+                                    period_opts = _option_texts(period_sel)
                                     
                                     if not period_opts:
                                         self._add_log(f"⚠️ No periods for Sy:{survey_no} H:{hissa}")
@@ -1498,7 +2374,7 @@ class SearchWorker:
                                             
                                             # Verify page loaded (look for owner table)
                                             page_source = self.driver.page_source
-                                            if 'Session expired' in page_source or 'login again' in page_source.lower():
+                                            if _SESSION_EXPIRED_RE.search(page_source):
                                                 raise Exception("Session expired during fetch")
                                             
                                             # Successfully selected period - log it
@@ -1524,17 +2400,13 @@ class SearchWorker:
                                                     worker_id=self.worker_id
                                                 )
                                                 
-                                                record_dict = asdict(record)
+                                                record_dict = land_record_dict(record)
                                                 
                                                 # Check for match
-                                                is_match = any(v.lower() in owner['owner_name'].lower() for v in owner_variants if v)
-                                                
-                                                # SAVE TO PERSISTENT DATABASE (REAL-TIME)
-                                                if self.db and self.session_id:
-                                                    self.db.save_record(self.session_id, record_dict, is_match=is_match)
+                                                is_match = bool(owner_matcher and owner_matcher.search(owner['owner_name']))
                                                 
-                                                # Write to CSV (backup)
-                                                self.all_records_writer.write_record(record_dict)
+                                                # SAVE TO DATABASE + CSV BACKUP (batched per worker)
+                                                self._buffer_record(record_dict, is_match)
                                                 self.records_found += 1
                                                 
                                                 # FIXED: Sync worker stats to shared state for UI display
@@ -1542,17 +2414,16 @@ class SearchWorker:
                                                 
                                                 # Add to state for real-time UI display
                                                 with self.state_lock:
-                                                    self.state.all_records.append(record_dict)
-                                                    if len(self.state.all_records) > 500:
-                                                        self.state.all_records = self.state.all_records[-500:]
+                                                    self.state.add_record_row([
+                                                        village_name, survey_no, hissa, owner['owner_name'],
+                                                        owner['extent'], owner['khatah'], self.worker_id,
+                                                        1 if is_match else 0
+                                                    ])
                                                 
                                                 if is_match:
-                                                    self.matches_writer.write_record(record_dict)
                                                     self.matches_found += 1
                                                     # FIXED: Sync match count too
                                                     self._update_status(matches_found=self.matches_found)
-                                                    with self.state_lock:
-                                                        self.state.matches.append(record_dict)
                                                     self._add_log(f"🎯 MATCH: {owner['owner_name']} in {village_name} Sy:{survey_no}")
                                             
                                             # Successfully processed this period - stop trying others
@@ -1578,6 +2449,7 @@ class SearchWorker:
                                         matches_found=self.matches_found
                                     )
                                     self._update_global_stats()
+                                    self._flush_if_stale()
                                     
                                     # Successfully processed this hissa - break retry loop
                                     break
@@ -1592,14 +2464,7 @@ class SearchWorker:
                                         try:
                                             self.driver.get(Config.SERVICE2_URL)
                                             time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['district'])).select_by_value(self.params['district_code'])
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['taluk'])).select_by_value(self.params['taluk_code'])
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['hobli'])).select_by_value(hobli_code)
-                                            time.sleep(Config.POST_SELECT_WAIT)
-                                            Select(self.driver.find_element(By.ID, IDS['village'])).select_by_value(village_code)
-                                            time.sleep(Config.POST_SELECT_WAIT)
+                                            self._select_location(village_code, hobli_code)
                                             self.driver.find_element(By.ID, IDS['survey_no']).send_keys(str(survey_no))
                                             go_btn = self.driver.find_element(By.ID, IDS['go_btn'])
                                             self.driver.execute_script("arguments[0].click();", go_btn)
@@ -1621,6 +2486,7 @@ class SearchWorker:
                 # SUCCESSFULLY PROCESSED SURVEY - Move to next
                 # ═══════════════════════════════════════════════════════════════════════
                 survey_no += 1
+                form_ready = True
                         
             except Exception as e:
                 error_str = str(e).lower()
@@ -1720,6 +2586,7 @@ class SearchWorker:
                 try:
                     self._add_log(f"🏘️ Village {idx+1}/{len(self.villages)}: {village_name}")
                     self._search_village(village_code, village_name, hobli_code, hobli_name)
+                    self._flush_records()
                     
                     # ═══════════════════════════════════════════════════════════════════════
                     # SUCCESSFULLY PROCESSED - Track it!
@@ -1734,6 +2601,7 @@ class SearchWorker:
                     browser_crashes = 0  # Reset crash count on success
                     
                 except Exception as village_error:
+                    self._flush_records()  # Keep what the village yielded before failing
                     error_str = str(village_error).lower()
                     self._add_log(f"⚠️ Village error: {str(village_error)[:80]}")
                     
@@ -1778,6 +2646,7 @@ class SearchWorker:
                         self._add_log(f"📝 Non-critical error, continuing: {str(village_error)[:50]}")
                         idx += 1
             
+            self._flush_records()
             self._update_status(status='completed')
             self._add_log(f"✅ Completed: {self.records_found} records, {self.matches_found} matches")
             
@@ -1787,6 +2656,7 @@ class SearchWorker:
             self.logger.error(f"Worker failed: {traceback.format_exc()}")
             
         finally:
+            self._flush_records()
             self._close_browser()
             self._update_global_stats()
 
@@ -1817,6 +2687,10 @@ class ParallelSearchCoordinator:
         # Database integration
         self.db = get_database()
         self.current_session_id: Optional[str] = None
+        
+        # Published get_state() snapshot: (built_at, state_dict)
+        self._snapshot: Optional[Tuple[float, dict]] = None
+        self._snapshot_lock = threading.Lock()
     
     def _prepare_villages(self, params: dict) -> List[Tuple[str, str, str, str]]:
         """
@@ -1828,7 +2702,6 @@ class ParallelSearchCoordinator:
         from selenium.webdriver.support.ui import Select
         from selenium.webdriver.chrome.options import Options
         from selenium.webdriver.chrome.service import Service
-        from webdriver_manager.chrome import ChromeDriverManager
         
         logger.info("Preparing village list...")
         
@@ -1838,7 +2711,7 @@ class ParallelSearchCoordinator:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+        driver = webdriver.Chrome(service=Service(_get_chromedriver_path()), options=options)
         
         try:
             driver.get(Config.SERVICE2_URL)
@@ -2012,26 +2885,24 @@ class ParallelSearchCoordinator:
             params['owner_variants'] = self.state.owner_variants
             self.current_session_id = self.db.create_session(params)
             with self.state_lock:
-                self.state.logs.append(f"💾 Database session created: {self.current_session_id}")
-                self.state.logs.append(f"📁 Data saved to: {self.db.db_path}")
+                self.state.add_log(f"💾 Database session created: {self.current_session_id}")
+                self.state.add_log(f"📁 Data saved to: {self.db.db_path}")
             
             # Initialize CSV writers (backup to database)
-            fieldnames = ['district', 'taluk', 'hobli', 'village', 'survey_no', 
-                         'surnoc', 'hissa', 'period', 'owner_name', 'extent', 
-                         'khatah', 'timestamp', 'worker_id']
+            fieldnames = list(LAND_RECORD_FIELDS)
             
             self.all_records_writer = ThreadSafeCSVWriter(self.state.all_records_file, fieldnames)
             self.matches_writer = ThreadSafeCSVWriter(self.state.matches_file, fieldnames)
             
             # Prepare villages
             with self.state_lock:
-                self.state.logs.append("Preparing village list...")
+                self.state.add_log("Preparing village list...")
             
             villages = self._prepare_villages(params)
             
             if not villages:
                 with self.state_lock:
-                    self.state.logs.append("No villages found to search")
+                    self.state.add_log("No villages found to search")
                     self.state.running = False
                 return False
             
@@ -2042,7 +2913,7 @@ class ParallelSearchCoordinator:
             # ═══════════════════════════════════════════════════════════════════════
             with self.state_lock:
                 self.state.villages_all = [v[1] for v in villages]  # Store village names
-                self.state.logs.append(f"📋 MASTER VILLAGE LIST: {len(villages)} villages to search")
+                self.state.add_log(f"📋 MASTER VILLAGE LIST: {len(villages)} villages to search")
                 
                 # Log first 10 and last 5 villages for verification
                 village_names = [v[1] for v in villages]
@@ -2050,7 +2921,7 @@ class ParallelSearchCoordinator:
                     preview = village_names[:10] + ['...'] + village_names[-5:]
                 else:
                     preview = village_names
-                self.state.logs.append(f"📍 Villages: {', '.join(preview)}")
+                self.state.add_log(f"📍 Villages: {', '.join(preview)}")
             
             # Register villages in database for resume capability
             self.db.register_villages(self.current_session_id, villages)
@@ -2071,7 +2942,7 @@ class ParallelSearchCoordinator:
                 )
             
             with self.state_lock:
-                self.state.logs.append(f"🚀 Starting {num_workers} workers for {len(villages)} villages")
+                self.state.add_log(f"🚀 Starting {num_workers} workers for {len(villages)} villages")
             
             # Start workers with staggered startup to avoid Chrome conflicts
             self.executor = ThreadPoolExecutor(max_workers=num_workers)
@@ -2095,7 +2966,7 @@ class ParallelSearchCoordinator:
                 if i < num_workers - 1:  # Don't wait after last worker
                     time.sleep(Config.WORKER_STARTUP_DELAY)
                     with self.state_lock:
-                        self.state.logs.append(f"Worker {i} started, launching next...")
+                        self.state.add_log(f"Worker {i} started, launching next...")
             
             # Start completion monitor
             threading.Thread(target=self._monitor_completion, daemon=True).start()
@@ -2106,7 +2977,7 @@ class ParallelSearchCoordinator:
             logger.error(f"Failed to start search: {traceback.format_exc()}")
             with self.state_lock:
                 self.state.running = False
-                self.state.logs.append(f"❌ Search failed to start: {str(e)[:100]}")
+                self.state.add_log(f"❌ Search failed to start: {str(e)[:100]}")
     
     def _monitor_completion(self):
         """Monitor workers and mark search as complete when all done"""
@@ -2131,27 +3002,27 @@ class ParallelSearchCoordinator:
                     retried = len(self.state.villages_retried)
                     failed = len(self.state.villages_failed)
                     
-                    self.state.logs.append("=" * 60)
-                    self.state.logs.append("📊 FINAL SEARCH SUMMARY")
-                    self.state.logs.append("=" * 60)
-                    self.state.logs.append(f"📋 Total villages in search: {total_villages}")
-                    self.state.logs.append(f"✅ Successfully processed: {processed}")
-                    self.state.logs.append(f"🔄 Villages retried (session expiry): {retried}")
-                    self.state.logs.append(f"❌ Villages failed: {failed}")
-                    self.state.logs.append(f"🔐 Session recovery attempts: {self.state.session_recoveries}")
-                    self.state.logs.append(f"📝 Total records found: {self.state.total_records}")
-                    self.state.logs.append(f"🎯 Owner matches: {self.state.total_matches}")
+                    self.state.add_log("=" * 60)
+                    self.state.add_log("📊 FINAL SEARCH SUMMARY")
+                    self.state.add_log("=" * 60)
+                    self.state.add_log(f"📋 Total villages in search: {total_villages}")
+                    self.state.add_log(f"✅ Successfully processed: {processed}")
+                    self.state.add_log(f"🔄 Villages retried (session expiry): {retried}")
+                    self.state.add_log(f"❌ Villages failed: {failed}")
+                    self.state.add_log(f"🔐 Session recovery attempts: {self.state.session_recoveries}")
+                    self.state.add_log(f"📝 Total records found: {self.state.total_records}")
+                    self.state.add_log(f"🎯 Owner matches: {self.state.total_matches}")
                     
                     if failed > 0:
-                        self.state.logs.append(f"⚠️ FAILED VILLAGES: {', '.join(self.state.villages_failed)}")
+                        self.state.add_log(f"⚠️ FAILED VILLAGES: {', '.join(self.state.villages_failed)}")
                     
                     if processed < total_villages:
                         missing = total_villages - processed
-                        self.state.logs.append(f"⚠️ WARNING: {missing} villages may have been missed!")
+                        self.state.add_log(f"⚠️ WARNING: {missing} villages may have been missed!")
                     else:
-                        self.state.logs.append("✅ ALL VILLAGES PROCESSED!")
+                        self.state.add_log("✅ ALL VILLAGES PROCESSED!")
                     
-                    self.state.logs.append("=" * 60)
+                    self.state.add_log("=" * 60)
                     
                     # ═══════════════════════════════════════════════════════════════════════
                     # UPDATE DATABASE SESSION STATUS
@@ -2164,10 +3035,28 @@ class ParallelSearchCoordinator:
                             total_records=self.state.total_records,
                             total_matches=self.state.total_matches
                         )
-                        self.state.logs.append(f"💾 Search saved to database: {self.current_session_id}")
+                        self.state.add_log(f"💾 Search saved to database: {self.current_session_id}")
                     
                     logger.info("Search completed")
                     break
+        
+        self.close_outputs()
+        if self.state.completed:
+            self.db.checkpoint()
+    
+    def flush_outputs(self):
+        """Flush workers' buffered records, then the CSV writers, so the files on disk are current"""
+        for worker in list(self.workers):
+            worker._flush_records()
+        for writer in (self.all_records_writer, self.matches_writer):
+            if writer:
+                writer.flush()
+    
+    def close_outputs(self):
+        """Flush and close the CSV backups once the search is over"""
+        for writer in (self.all_records_writer, self.matches_writer):
+            if writer:
+                writer.close()
     
     def stop_search(self):
         """Stop all workers immediately"""
@@ -2177,7 +3066,7 @@ class ParallelSearchCoordinator:
         self.state.running = False
         
         with self.state_lock:
-            self.state.logs.append("⏹️ Stop requested by user - shutting down workers...")
+            self.state.add_log("⏹️ Stop requested by user - shutting down workers...")
         
         # Force shutdown executor (don't wait for workers)
         if self.executor:
@@ -2197,15 +3086,37 @@ class ParallelSearchCoordinator:
                         total_records=self.state.total_records,
                         total_matches=self.state.total_matches
                     )
+                self.db.checkpoint()
             except Exception as e:
                 logger.error(f"Failed to update DB on stop: {e}")
         
         threading.Thread(target=update_db_async, daemon=True).start()
+        self.close_outputs()
         
         logger.info("Stop search completed")
     
     def get_state(self) -> dict:
-        """Get current search state as dict"""
+        """
+        Get current search state as dict.
+        
+        Status polls and SSE streams read a published snapshot instead of
+        taking state_lock, which the workers hold while recording results.
+        The snapshot is rebuilt at most every STATE_SNAPSHOT_TTL seconds, by
+        one reader at a time; others keep using the previous one meanwhile.
+        Callers get a shallow copy and may replace top-level keys.
+        """
+        snapshot = self._snapshot  # Single reference read, atomic under the GIL
+        if snapshot is None or time.monotonic() - snapshot[0] >= Config.STATE_SNAPSHOT_TTL:
+            if self._snapshot_lock.acquire(blocking=snapshot is None):
+                try:
+                    snapshot = (time.monotonic(), self._build_state())
+                    self._snapshot = snapshot
+                finally:
+                    self._snapshot_lock.release()
+        return dict(snapshot[1])
+    
+    def _build_state(self) -> dict:
+        """Copy the live state into a plain dict (under state_lock)"""
         with self.state_lock:
             state_dict = {
                 'running': self.state.running,
@@ -2221,10 +3132,11 @@ class ParallelSearchCoordinator:
                 'progress': int((self.state.villages_completed / max(self.state.total_villages, 1)) * 100),
                 'all_records_file': self.state.all_records_file,
                 'matches_file': self.state.matches_file,
-                'logs': self.state.logs[-30:],  # Last 30 logs (increased)
-                # Real-time records for UI (last 100)
-                'all_records': self.state.all_records[-100:],
-                'matches': self.state.matches,
+                'logs': _tail(self.state.logs, 30),  # Last 30 logs (increased)
+                'logs_total': self.state.logs_total,
+                # Real-time record rows for UI (last 100, matches flagged)
+                'all_records': _tail(self.state.all_records, 100),
+                'all_records_total': self.state.all_records_total,
                 # BULLETPROOF VILLAGE TRACKING
                 'village_tracking': {
                     'total_to_search': len(self.state.villages_all),
@@ -2266,545 +3178,1552 @@ CORS(app)
 
 # Global instances
 api = BhoomiAPI()
-coordinator = ParallelSearchCoordinator()
+
+# The active search lives on the app; it starts out as an idle coordinator
+# so status/stop/download calls before the first search see empty defaults.
+_coordinator_lock = threading.Lock()
+app.extensions['search_coordinator'] = ParallelSearchCoordinator()
+
+def get_coordinator() -> ParallelSearchCoordinator:
+    """Get the coordinator of the current (or last) search"""
+    coordinator = app.extensions.get('search_coordinator')
+    if coordinator is None:
+        with _coordinator_lock:
+            coordinator = app.extensions.setdefault('search_coordinator', ParallelSearchCoordinator())
+    return coordinator
+
+def replace_coordinator() -> ParallelSearchCoordinator:
+    """Install a fresh coordinator for a new search"""
+    with _coordinator_lock:
+        coordinator = ParallelSearchCoordinator()
+        app.extensions['search_coordinator'] = coordinator
+    return coordinator
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
-# HTML TEMPLATE (Enhanced with parallel worker visualization)
+# STATIC ASSETS (served from /assets/ with long-lived cache headers)
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
-HTML_TEMPLATE = '''
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>POWER-BHOOMI v3.0 | Bulletproof Edition</title>
-    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&family=Noto+Sans+Kannada:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-    <style>
-        :root {
-            --bg-primary: #0a0e17;
-            --bg-secondary: #111827;
-            --bg-card: #1a2332;
-            --bg-input: #0d1421;
-            --accent-primary: #f59e0b;
-            --accent-secondary: #d97706;
-            --accent-glow: rgba(245, 158, 11, 0.3);
-            --text-primary: #f3f4f6;
-            --text-secondary: #9ca3af;
-            --text-muted: #6b7280;
-            --border-color: #374151;
-            --success: #10b981;
-            --error: #ef4444;
-            --warning: #f59e0b;
-            --info: #3b82f6;
-        }
-        
-        * { margin: 0; padding: 0; box-sizing: border-box; }
-        
-        body {
-            font-family: 'Outfit', sans-serif;
-            background: var(--bg-primary);
-            color: var(--text-primary);
-            min-height: 100vh;
-            background-image: 
-                radial-gradient(ellipse at 20% 20%, rgba(245, 158, 11, 0.08) 0%, transparent 50%),
-                radial-gradient(ellipse at 80% 80%, rgba(217, 119, 6, 0.05) 0%, transparent 50%);
-        }
-        
-        .kannada { font-family: 'Noto Sans Kannada', sans-serif; }
-        .mono { font-family: 'JetBrains Mono', monospace; }
-        
-        /* Header */
-        .header {
-            padding: 1rem 2rem;
-            background: linear-gradient(180deg, rgba(26, 35, 50, 0.95) 0%, transparent 100%);
-            border-bottom: 1px solid rgba(245, 158, 11, 0.1);
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            backdrop-filter: blur(20px);
-        }
-        
-        .header-content {
-            max-width: 1600px;
-            margin: 0 auto;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }
-        
-        .logo {
-            display: flex;
-            align-items: center;
-            gap: 1rem;
-        }
-        
-        .logo-icon {
-            width: 48px;
-            height: 48px;
-            background: linear-gradient(135deg, var(--accent-primary), var(--accent-secondary));
-            border-radius: 12px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            font-size: 1.5rem;
-            box-shadow: 0 4px 20px var(--accent-glow);
-        }
-        
-        .logo-text h1 {
-            font-size: 1.4rem;
-            font-weight: 700;
-            background: linear-gradient(135deg, var(--accent-primary), #fcd34d);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-        }
-        
-        .logo-text p {
-            font-size: 0.7rem;
-            color: var(--text-secondary);
-            letter-spacing: 2px;
-            text-transform: uppercase;
-        }
-        
-        .version-badge {
-            padding: 0.35rem 0.75rem;
-            background: rgba(59, 130, 246, 0.15);
-            border: 1px solid rgba(59, 130, 246, 0.3);
-            border-radius: 6px;
-            font-size: 0.75rem;
-            color: var(--info);
-            font-weight: 600;
-        }
-        
-        /* Main Layout */
-        .main-container {
-            max-width: 1600px;
-            margin: 0 auto;
-            padding: 1.5rem;
-            display: grid;
-            grid-template-columns: 380px 1fr;
-            gap: 1.5rem;
-        }
-        
-        /* Cards */
-        .card {
-            background: var(--bg-card);
-            border-radius: 16px;
-            border: 1px solid var(--border-color);
-            padding: 1.5rem;
-        }
-        
-        .card-title {
-            font-size: 1.1rem;
-            font-weight: 600;
-            margin-bottom: 1.25rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        
-        .card-title::before {
-            content: '';
-            width: 3px;
-            height: 20px;
-            background: var(--accent-primary);
-            border-radius: 2px;
-        }
-        
-        /* Form Elements */
-        .form-group { margin-bottom: 1rem; }
-        
-        .form-label {
-            display: block;
-            font-size: 0.8rem;
-            font-weight: 500;
-            color: var(--text-secondary);
-            margin-bottom: 0.4rem;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }
-        
-        .form-select, .form-input {
-            width: 100%;
-            padding: 0.75rem 1rem;
-            background: var(--bg-input);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            color: var(--text-primary);
-            font-family: inherit;
-            font-size: 0.9rem;
-            transition: all 0.2s;
-        }
-        
-        .form-select {
-            appearance: none;
-            background-image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='20' height='20' viewBox='0 0 24 24' fill='none' stroke='%239ca3af' stroke-width='2'%3E%3Cpolyline points='6 9 12 15 18 9'%3E%3C/polyline%3E%3C/svg%3E");
-            background-repeat: no-repeat;
-            background-position: right 0.75rem center;
-            padding-right: 2.5rem;
-            cursor: pointer;
-        }
-        
-        .form-select:focus, .form-input:focus {
-            outline: none;
-            border-color: var(--accent-primary);
-            box-shadow: 0 0 0 3px var(--accent-glow);
-        }
-        
-        .form-select:disabled { opacity: 0.5; cursor: not-allowed; }
-        
-        /* Buttons */
-        .btn {
-            padding: 0.875rem 1.5rem;
-            border: none;
-            border-radius: 10px;
-            font-family: inherit;
-            font-size: 0.95rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 0.5rem;
-        }
-        
-        .btn-primary {
-            width: 100%;
-            background: linear-gradient(135deg, var(--accent-primary), var(--accent-secondary));
-            color: var(--bg-primary);
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-top: 1rem;
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 25px var(--accent-glow);
-        }
-        
-        .btn-primary:disabled { opacity: 0.6; cursor: not-allowed; transform: none; }
-        
-        .btn-stop {
-            background: linear-gradient(135deg, var(--error), #dc2626);
-        }
-        
-        .btn-sm {
-            padding: 0.5rem 1rem;
-            font-size: 0.85rem;
-        }
-        
-        /* Workers Panel */
-        .workers-grid {
-            display: grid;
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.75rem;
-            margin-bottom: 1rem;
-        }
-        
-        .worker-card {
-            background: var(--bg-input);
-            border-radius: 10px;
-            padding: 1rem;
-            border: 1px solid var(--border-color);
-        }
-        
-        .worker-header {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            margin-bottom: 0.75rem;
-        }
-        
-        .worker-id {
-            font-weight: 600;
-            font-size: 0.85rem;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        
-        .worker-status {
-            font-size: 0.7rem;
-            padding: 0.2rem 0.5rem;
-            border-radius: 4px;
-            text-transform: uppercase;
-            font-weight: 600;
-        }
-        
-        .worker-status.running { background: rgba(16, 185, 129, 0.2); color: var(--success); }
-        .worker-status.completed { background: rgba(59, 130, 246, 0.2); color: var(--info); }
-        .worker-status.failed { background: rgba(239, 68, 68, 0.2); color: var(--error); }
-        .worker-status.idle { background: rgba(107, 114, 128, 0.2); color: var(--text-muted); }
-        
-        .worker-village {
-            font-size: 0.8rem;
-            color: var(--text-secondary);
-            margin-bottom: 0.5rem;
-            white-space: nowrap;
-            overflow: hidden;
-            text-overflow: ellipsis;
-        }
-        
-        .worker-progress {
-            height: 4px;
-            background: var(--bg-secondary);
-            border-radius: 2px;
-            overflow: hidden;
-            margin-bottom: 0.5rem;
-        }
-        
-        .worker-progress-fill {
-            height: 100%;
-            background: var(--accent-primary);
-            transition: width 0.3s;
-        }
-        
-        .worker-stats {
-            display: flex;
-            justify-content: space-between;
-            font-size: 0.75rem;
-            color: var(--text-muted);
-        }
-        
-        /* Overall Progress */
-        .overall-progress {
-            background: var(--bg-input);
-            border-radius: 12px;
-            padding: 1.25rem;
-            margin-bottom: 1rem;
-        }
-        
-        .progress-header {
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 0.75rem;
-        }
-        
-        .progress-label { font-size: 0.9rem; font-weight: 500; }
-        .progress-percent { font-size: 1.5rem; font-weight: 700; color: var(--accent-primary); }
-        
-        .progress-bar {
-            height: 10px;
-            background: var(--bg-secondary);
-            border-radius: 5px;
-            overflow: hidden;
-            margin-bottom: 0.75rem;
-        }
-        
-        .progress-fill {
-            height: 100%;
-            background: linear-gradient(90deg, var(--accent-primary), var(--accent-secondary));
-            border-radius: 5px;
-            transition: width 0.5s;
-        }
-        
-        .progress-stats {
-            display: flex;
-            justify-content: space-around;
-            text-align: center;
-        }
-        
-        .progress-stat-value {
-            font-size: 1.25rem;
-            font-weight: 700;
-            color: var(--text-primary);
-        }
-        
-        .progress-stat-label {
-            font-size: 0.7rem;
-            color: var(--text-muted);
-            text-transform: uppercase;
-        }
-        
-        /* Stats Grid */
-        .stats-grid {
-            display: grid;
-            grid-template-columns: repeat(4, 1fr);
-            gap: 0.75rem;
-            margin-bottom: 1rem;
-        }
-        
-        .stat-card {
-            background: var(--bg-input);
-            border-radius: 10px;
-            padding: 1rem;
-            text-align: center;
-        }
-        
-        .stat-value {
-            font-size: 1.75rem;
-            font-weight: 700;
-            color: var(--accent-primary);
-        }
-        
-        .stat-label {
-            font-size: 0.7rem;
-            color: var(--text-muted);
-            text-transform: uppercase;
-            margin-top: 0.25rem;
-        }
-        
-        /* Logs */
-        .logs-container {
-            background: var(--bg-input);
-            border-radius: 10px;
-            padding: 1rem;
-            max-height: 200px;
-            overflow-y: auto;
-            font-family: 'JetBrains Mono', monospace;
-            font-size: 0.75rem;
-        }
-        
-        .log-entry {
-            padding: 0.3rem 0;
-            border-bottom: 1px solid rgba(255,255,255,0.03);
-            color: var(--text-muted);
-        }
-        
-        .log-entry:last-child { border-bottom: none; }
-        
-        /* Scrollbar */
-        ::-webkit-scrollbar { width: 6px; height: 6px; }
-        ::-webkit-scrollbar-track { background: var(--bg-input); }
-        ::-webkit-scrollbar-thumb { background: var(--border-color); border-radius: 3px; }
-        
-        /* Spinner */
-        .spinner {
-            width: 18px;
-            height: 18px;
-            border: 2px solid transparent;
-            border-top-color: currentColor;
-            border-radius: 50%;
-            animation: spin 0.8s linear infinite;
-        }
-        
-        @keyframes spin { to { transform: rotate(360deg); } }
-        
-        /* Tab Buttons */
-        .tab-btn {
-            padding: 0.6rem 1rem;
-            background: var(--bg-input);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-            color: var(--text-secondary);
-            font-family: inherit;
-            font-size: 0.85rem;
-            font-weight: 500;
-            cursor: pointer;
-            transition: all 0.2s;
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-        }
-        
-        .tab-btn:hover { border-color: var(--accent-primary); color: var(--text-primary); }
-        .tab-btn.active { background: var(--accent-primary); border-color: var(--accent-primary); color: var(--bg-primary); }
-        
-        .badge {
-            background: var(--bg-secondary);
-            padding: 0.15rem 0.5rem;
-            border-radius: 10px;
-            font-size: 0.75rem;
-            font-weight: 600;
-        }
-        
-        .tab-btn.active .badge { background: rgba(0,0,0,0.2); color: var(--bg-primary); }
-        .match-badge { background: var(--success) !important; color: white !important; }
-        
-        /* Data Table */
-        .table-container {
-            max-height: 350px;
-            overflow-y: auto;
-            border-radius: 10px;
-            border: 1px solid var(--border-color);
-        }
-        
-        .data-table {
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 0.85rem;
-        }
-        
-        .data-table th {
-            background: var(--bg-secondary);
-            padding: 0.75rem 1rem;
-            text-align: left;
-            font-weight: 600;
-            color: var(--text-secondary);
-            text-transform: uppercase;
-            font-size: 0.7rem;
-            letter-spacing: 0.5px;
-            position: sticky;
-            top: 0;
-            z-index: 1;
-        }
-        
-        .data-table td {
-            padding: 0.6rem 1rem;
-            border-bottom: 1px solid var(--border-color);
-            color: var(--text-primary);
-        }
-        
-        .data-table tr:hover td { background: rgba(245, 158, 11, 0.05); }
-        .data-table tr.match-row td { background: rgba(16, 185, 129, 0.1); }
-        .data-table tr.match-row:hover td { background: rgba(16, 185, 129, 0.15); }
-        
-        .empty-row {
-            text-align: center;
-            color: var(--text-muted);
-            padding: 2rem !important;
-        }
-        
-        .owner-cell { font-weight: 500; }
-        .owner-cell.match { color: var(--success); }
-        
-        /* Responsive */
-        @media (max-width: 1200px) {
-            .main-container { grid-template-columns: 1fr; }
-            .workers-grid { grid-template-columns: repeat(2, 1fr); }
-            .stats-grid { grid-template-columns: repeat(2, 1fr); }
-        }
-        
-        @media (max-width: 768px) {
-            .workers-grid { grid-template-columns: 1fr; }
-        }
-    </style>
-</head>
-<body>
-    <header class="header">
-        <div class="header-content">
-            <div class="logo">
-                <div class="logo-icon">⚡</div>
-                <div class="logo-text">
-                    <h1>POWER-BHOOMI</h1>
-                    <p>Parallel Search Engine</p>
-                </div>
-            </div>
-            <div class="version-badge">v3.0 🛡️ Bulletproof • 4 Workers</div>
-        </div>
-    </header>
+APP_CSS = '''
+    :root {
+        --bg-primary: #0a0e17;
+        --bg-secondary: #111827;
+        --bg-card: #1a2332;
+        --bg-input: #0d1421;
+        --accent-primary: #f59e0b;
+        --accent-secondary: #d97706;
+        --accent-glow: rgba(245, 158, 11, 0.3);
+        --text-primary: #f3f4f6;
+        --text-secondary: #9ca3af;
+        --text-muted: #6b7280;
+        --border-color: #374151;
+        --success: #10b981;
+        --error: #ef4444;
+        --warning: #f59e0b;
+        --info: #3b82f6;
+    }
     
-    <main class="main-container">
-        <aside class="card">
-            <h2 class="card-title">Search Configuration</h2>
-            
-            <div class="form-group">
-                <label class="form-label">Owner Name <span class="kannada">(ಮಾಲೀಕರ ಹೆಸರು)</span></label>
-                <input type="text" id="ownerName" class="form-input kannada" placeholder="Enter owner name...">
-            </div>
-            
-            <div class="form-group">
-                <label class="form-label">District <span class="kannada">(ಜಿಲ್ಲೆ)</span></label>
-                <select id="district" class="form-select">
-                    <option value="">Loading...</option>
-                </select>
-            </div>
-            
-            <div class="form-group">
-                <label class="form-label">Taluk <span class="kannada">(ತಾಲೂಕು)</span></label>
-                <select id="taluk" class="form-select" disabled>
-                    <option value="">Select district first</option>
+    * { margin: 0; padding: 0; box-sizing: border-box; }
+    
+    body {
+        font-family: 'Outfit', sans-serif;
+        background: var(--bg-primary);
+        color: var(--text-primary);
+        min-height: 100vh;
+        background-image: 
+            radial-gradient(ellipse at 20% 20%, rgba(245, 158, 11, 0.08) 0%, transparent 50%),
+            radial-gradient(ellipse at 80% 80%, rgba(217, 119, 6, 0.05) 0%, transparent 50%);
+    }
+    
+    .kannada { font-family: 'Noto Sans Kannada', sans-serif; }
+    .mono { font-family: 'JetBrains Mono', monospace; }
+    
+    /* Header */
+    .header {
+        padding: 1rem 2rem;
+        background: linear-gradient(180deg, rgba(26, 35, 50, 0.95) 0%, transparent 100%);
+        border-bottom: 1px solid rgba(245, 158, 11, 0.1);
+        position: sticky;
+        top: 0;
+        z-index: 100;
+        backdrop-filter: blur(20px);
+    }
+    
+    .header-content {
+        max-width: 1600px;
+        margin: 0 auto;
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+    }
+    
+    .logo {
+        display: flex;
+        align-items: center;
+        gap: 1rem;
+    }
+    
+    .logo-icon {
+        width: 48px;
+        height: 48px;
+        background: linear-gradient(135deg, var(--accent-primary), var(--accent-secondary));
+        border-radius: 12px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-size: 1.5rem;
+        box-shadow: 0 4px 20px var(--accent-glow);
+    }
+    
+    .logo-text h1 {
+        font-size: 1.4rem;
+        font-weight: 700;
+        background: linear-gradient(135deg, var(--accent-primary), #fcd34d);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+    }
+    
+    .logo-text p {
+        font-size: 0.7rem;
+        color: var(--text-secondary);
+        letter-spacing: 2px;
+        text-transform: uppercase;
+    }
+    
+    .version-badge {
+        padding: 0.35rem 0.75rem;
+        background: rgba(59, 130, 246, 0.15);
+        border: 1px solid rgba(59, 130, 246, 0.3);
+        border-radius: 6px;
+        font-size: 0.75rem;
+        color: var(--info);
+        font-weight: 600;
+    }
+    
+    /* Main Layout */
+    .main-container {
+        max-width: 1600px;
+        margin: 0 auto;
+        padding: 1.5rem;
+        display: grid;
+        grid-template-columns: 380px 1fr;
+        gap: 1.5rem;
+    }
+    
+    /* Cards */
+    .card {
+        background: var(--bg-card);
+        border-radius: 16px;
+        border: 1px solid var(--border-color);
+        padding: 1.5rem;
+    }
+    
+    .card-title {
+        font-size: 1.1rem;
+        font-weight: 600;
+        margin-bottom: 1.25rem;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .card-title::before {
+        content: '';
+        width: 3px;
+        height: 20px;
+        background: var(--accent-primary);
+        border-radius: 2px;
+    }
+    
+    /* Form Elements */
+    .form-group { margin-bottom: 1rem; }
+    
+    .form-label {
+        display: block;
+        font-size: 0.8rem;
+        font-weight: 500;
+        color: var(--text-secondary);
+        margin-bottom: 0.4rem;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+    
+    .form-select, .form-input {
+        width: 100%;
+        padding: 0.75rem 1rem;
+        background: var(--bg-input);
+        border: 1px solid var(--border-color);
+        border-radius: 8px;
+        color: var(--text-primary);
+        font-family: inherit;
+        font-size: 0.9rem;
+        transition: all 0.2s;
+    }
+    
+    .form-select {
+        appearance: none;
+        background-image: url("data:image/svg+xml,%3Csvg xmlns='http://www.w3.org/2000/svg' width='20' height='20' viewBox='0 0 24 24' fill='none' stroke='%239ca3af' stroke-width='2'%3E%3Cpolyline points='6 9 12 15 18 9'%3E%3C/polyline%3E%3C/svg%3E");
+        background-repeat: no-repeat;
+        background-position: right 0.75rem center;
+        padding-right: 2.5rem;
+        cursor: pointer;
+    }
+    
+    .form-select:focus, .form-input:focus {
+        outline: none;
+        border-color: var(--accent-primary);
+        box-shadow: 0 0 0 3px var(--accent-glow);
+    }
+    
+    .form-select:disabled { opacity: 0.5; cursor: not-allowed; }
+    
+    /* Buttons */
+    .btn {
+        padding: 0.875rem 1.5rem;
+        border: none;
+        border-radius: 10px;
+        font-family: inherit;
+        font-size: 0.95rem;
+        font-weight: 600;
+        cursor: pointer;
+        transition: all 0.2s;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        gap: 0.5rem;
+    }
+    
+    .btn-primary {
+        width: 100%;
+        background: linear-gradient(135deg, var(--accent-primary), var(--accent-secondary));
+        color: var(--bg-primary);
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        margin-top: 1rem;
+    }
+    
+    .btn-primary:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 6px 25px var(--accent-glow);
+    }
+    
+    .btn-primary:disabled { opacity: 0.6; cursor: not-allowed; transform: none; }
+    
+    .btn-stop {
+        background: linear-gradient(135deg, var(--error), #dc2626);
+    }
+    
+    .btn-sm {
+        padding: 0.5rem 1rem;
+        font-size: 0.85rem;
+    }
+    
+    /* Workers Panel */
+    .workers-grid {
+        display: grid;
+        grid-template-columns: repeat(2, 1fr);
+        gap: 0.75rem;
+        margin-bottom: 1rem;
+    }
+    
+    .worker-card {
+        background: var(--bg-input);
+        border-radius: 10px;
+        padding: 1rem;
+        border: 1px solid var(--border-color);
+    }
+    
+    .worker-header {
+        display: flex;
+        align-items: center;
+        justify-content: space-between;
+        margin-bottom: 0.75rem;
+    }
+    
+    .worker-id {
+        font-weight: 600;
+        font-size: 0.85rem;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .worker-status {
+        font-size: 0.7rem;
+        padding: 0.2rem 0.5rem;
+        border-radius: 4px;
+        text-transform: uppercase;
+        font-weight: 600;
+    }
+    
+    .worker-status.running { background: rgba(16, 185, 129, 0.2); color: var(--success); }
+    .worker-status.completed { background: rgba(59, 130, 246, 0.2); color: var(--info); }
+    .worker-status.failed { background: rgba(239, 68, 68, 0.2); color: var(--error); }
+    .worker-status.idle { background: rgba(107, 114, 128, 0.2); color: var(--text-muted); }
+    
+    .worker-village {
+        font-size: 0.8rem;
+        color: var(--text-secondary);
+        margin-bottom: 0.5rem;
+        white-space: nowrap;
+        overflow: hidden;
+        text-overflow: ellipsis;
+    }
+    
+    .worker-progress {
+        height: 4px;
+        background: var(--bg-secondary);
+        border-radius: 2px;
+        overflow: hidden;
+        margin-bottom: 0.5rem;
+    }
+    
+    .worker-progress-fill {
+        height: 100%;
+        background: var(--accent-primary);
+        transition: width 0.3s;
+    }
+    
+    .worker-stats {
+        display: flex;
+        justify-content: space-between;
+        font-size: 0.75rem;
+        color: var(--text-muted);
+    }
+    
+    /* Overall Progress */
+    .overall-progress {
+        background: var(--bg-input);
+        border-radius: 12px;
+        padding: 1.25rem;
+        margin-bottom: 1rem;
+    }
+    
+    .progress-header {
+        display: flex;
+        justify-content: space-between;
+        margin-bottom: 0.75rem;
+    }
+    
+    .progress-label { font-size: 0.9rem; font-weight: 500; }
+    .progress-percent { font-size: 1.5rem; font-weight: 700; color: var(--accent-primary); }
+    
+    .progress-bar {
+        height: 10px;
+        background: var(--bg-secondary);
+        border-radius: 5px;
+        overflow: hidden;
+        margin-bottom: 0.75rem;
+    }
+    
+    .progress-fill {
+        height: 100%;
+        background: linear-gradient(90deg, var(--accent-primary), var(--accent-secondary));
+        border-radius: 5px;
+        transition: width 0.5s;
+    }
+    
+    .progress-stats {
+        display: flex;
+        justify-content: space-around;
+        text-align: center;
+    }
+    
+    .progress-stat-value {
+        font-size: 1.25rem;
+        font-weight: 700;
+        color: var(--text-primary);
+    }
+    
+    .progress-stat-label {
+        font-size: 0.7rem;
+        color: var(--text-muted);
+        text-transform: uppercase;
+    }
+    
+    /* Stats Grid */
+    .stats-grid {
+        display: grid;
+        grid-template-columns: repeat(4, 1fr);
+        gap: 0.75rem;
+        margin-bottom: 1rem;
+    }
+    
+    .stat-card {
+        background: var(--bg-input);
+        border-radius: 10px;
+        padding: 1rem;
+        text-align: center;
+    }
+    
+    .stat-value {
+        font-size: 1.75rem;
+        font-weight: 700;
+        color: var(--accent-primary);
+    }
+    
+    .stat-label {
+        font-size: 0.7rem;
+        color: var(--text-muted);
+        text-transform: uppercase;
+        margin-top: 0.25rem;
+    }
+    
+    /* Logs */
+    /* column-reverse: entries are appended in log order and shown newest-first */
+    .logs-container {
+        contain: content;
+        display: flex;
+        flex-direction: column-reverse;
+        background: var(--bg-input);
+        border-radius: 10px;
+        padding: 1rem;
+        max-height: 200px;
+        overflow-y: auto;
+        font-family: 'JetBrains Mono', monospace;
+        font-size: 0.75rem;
+    }
+    
+    .log-entry {
+        padding: 0.3rem 0;
+        border-bottom: 1px solid rgba(255,255,255,0.03);
+        color: var(--text-muted);
+    }
+    
+    .log-entry:first-child { border-bottom: none; }
+    
+    /* Skip layout/paint for log lines scrolled out of view (up to 500 kept) */
+    .logs-container .log-entry {
+        content-visibility: auto;
+        contain-intrinsic-size: auto 28px;
+    }
+    
+    /* Scrollbar */
+    ::-webkit-scrollbar { width: 6px; height: 6px; }
+    ::-webkit-scrollbar-track { background: var(--bg-input); }
+    ::-webkit-scrollbar-thumb { background: var(--border-color); border-radius: 3px; }
+    
+    /* Spinner */
+    .spinner {
+        width: 18px;
+        height: 18px;
+        border: 2px solid transparent;
+        border-top-color: currentColor;
+        border-radius: 50%;
+        animation: spin 0.8s linear infinite;
+    }
+    
+    @keyframes spin { to { transform: rotate(360deg); } }
+    
+    /* Tab Buttons */
+    .tab-btn {
+        padding: 0.6rem 1rem;
+        background: var(--bg-input);
+        border: 1px solid var(--border-color);
+        border-radius: 8px;
+        color: var(--text-secondary);
+        font-family: inherit;
+        font-size: 0.85rem;
+        font-weight: 500;
+        cursor: pointer;
+        transition: all 0.2s;
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    .tab-btn:hover { border-color: var(--accent-primary); color: var(--text-primary); }
+    .tab-btn.active { background: var(--accent-primary); border-color: var(--accent-primary); color: var(--bg-primary); }
+    
+    .badge {
+        background: var(--bg-secondary);
+        padding: 0.15rem 0.5rem;
+        border-radius: 10px;
+        font-size: 0.75rem;
+        font-weight: 600;
+    }
+    
+    .tab-btn.active .badge { background: rgba(0,0,0,0.2); color: var(--bg-primary); }
+    .match-badge { background: var(--success) !important; color: white !important; }
+    
+    /* Data Table */
+    .table-container {
+        max-height: 350px;
+        overflow-y: auto;
+        contain: content;  /* Row churn stays inside the scroller */
+        border-radius: 10px;
+        border: 1px solid var(--border-color);
+    }
+    
+    .data-table {
+        width: 100%;
+        border-collapse: collapse;
+        font-size: 0.85rem;
+    }
+    
+    .data-table th {
+        background: var(--bg-secondary);
+        padding: 0.75rem 1rem;
+        text-align: left;
+        font-weight: 600;
+        color: var(--text-secondary);
+        text-transform: uppercase;
+        font-size: 0.7rem;
+        letter-spacing: 0.5px;
+        position: sticky;
+        top: 0;
+        z-index: 1;
+    }
+    
+    .data-table td {
+        padding: 0.6rem 1rem;
+        border-bottom: 1px solid var(--border-color);
+        color: var(--text-primary);
+    }
+    
+    .data-table tr:hover td { background: rgba(245, 158, 11, 0.05); }
+    .data-table tr.match-row td { background: rgba(16, 185, 129, 0.1); }
+    .data-table tr.match-row:hover td { background: rgba(16, 185, 129, 0.15); }
+    .data-table tr.spacer-row td { padding: 0; border: none; background: none; }
+    
+    .empty-row {
+        text-align: center;
+        color: var(--text-muted);
+        padding: 2rem !important;
+    }
+    
+    .owner-cell { font-weight: 500; }
+    .owner-cell.match { color: var(--success); }
+    
+    /* Responsive */
+    @media (max-width: 1200px) {
+        .main-container { grid-template-columns: 1fr; }
+        .workers-grid { grid-template-columns: repeat(2, 1fr); }
+        .stats-grid { grid-template-columns: repeat(2, 1fr); }
+    }
+    
+    @media (max-width: 768px) {
+        .workers-grid { grid-template-columns: 1fr; }
+    }
+    
+    /* Modal Styles */
+    .modal {
+        position: fixed;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        z-index: 1000;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+    }
+    
+    .modal-overlay {
+        position: absolute;
+        top: 0;
+        left: 0;
+        width: 100%;
+        height: 100%;
+        background: rgba(0, 0, 0, 0.7);
+        backdrop-filter: blur(4px);
+    }
+    
+    .modal-content {
+        position: relative;
+        background: var(--bg-card);
+        border-radius: 16px;
+        border: 1px solid var(--border-color);
+        width: 90%;
+        max-width: 550px;
+        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
+        animation: modalSlideIn 0.3s ease;
+    }
+    
+    @keyframes modalSlideIn {
+        from { opacity: 0; transform: translateY(-20px); }
+        to { opacity: 1; transform: translateY(0); }
+    }
+    
+    .modal-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        padding: 1.25rem 1.5rem;
+        border-bottom: 1px solid var(--border-color);
+    }
+    
+    .modal-header h3 {
+        margin: 0;
+        font-size: 1.2rem;
+        color: var(--text-primary);
+    }
+    
+    .modal-close {
+        background: none;
+        border: none;
+        color: var(--text-muted);
+        font-size: 1.5rem;
+        cursor: pointer;
+        padding: 0;
+        line-height: 1;
+    }
+    
+    .modal-close:hover { color: var(--text-primary); }
+    
+    .modal-body {
+        padding: 1.5rem;
+    }
+    
+    .download-section {
+        display: flex;
+        flex-direction: column;
+        gap: 1rem;
+    }
+    
+    .download-card {
+        background: var(--bg-secondary);
+        border: 1px solid var(--border-color);
+        border-radius: 12px;
+        padding: 1.25rem;
+        display: grid;
+        grid-template-columns: auto 1fr auto;
+        gap: 1rem;
+        align-items: center;
+    }
+    
+    .download-card.match-card {
+        border-color: var(--success);
+        background: rgba(16, 185, 129, 0.05);
+    }
+    
+    .download-icon {
+        font-size: 2rem;
+        width: 50px;
+        height: 50px;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        background: var(--bg-input);
+        border-radius: 10px;
+    }
+    
+    .download-info h4 {
+        margin: 0 0 0.25rem 0;
+        color: var(--text-primary);
+        font-size: 1rem;
+    }
+    
+    .download-info p {
+        margin: 0;
+        color: var(--text-secondary);
+        font-size: 0.85rem;
+    }
+    
+    .file-path {
+        font-size: 0.75rem !important;
+        color: var(--text-muted) !important;
+        font-family: monospace;
+        word-break: break-all;
+    }
+    
+    .download-actions {
+        display: flex;
+        flex-direction: column;
+        gap: 0.5rem;
+    }
+    
+    .filename-input {
+        padding: 0.5rem 0.75rem;
+        background: var(--bg-input);
+        border: 1px solid var(--border-color);
+        border-radius: 6px;
+        color: var(--text-primary);
+        font-size: 0.85rem;
+        width: 160px;
+    }
+    
+    .filename-input:focus {
+        outline: none;
+        border-color: var(--accent-primary);
+    }
+    
+    .btn-download {
+        padding: 0.5rem 1rem;
+        background: var(--accent-primary);
+        color: var(--bg-primary);
+        border: none;
+        border-radius: 6px;
+        font-weight: 600;
+        cursor: pointer;
+        transition: all 0.2s;
+    }
+    
+    .btn-download:hover { background: var(--accent-hover); }
+    .btn-download.match-btn { background: var(--success); }
+    .btn-download.match-btn:hover { background: #059669; }
+    .btn-download:disabled { opacity: 0.5; cursor: not-allowed; }
+    
+    .modal-note {
+        margin-top: 1rem;
+        padding: 0.75rem 1rem;
+        background: rgba(245, 158, 11, 0.1);
+        border-radius: 8px;
+        border-left: 3px solid var(--accent-primary);
+    }
+    
+    .modal-note p {
+        margin: 0;
+        font-size: 0.85rem;
+        color: var(--text-secondary);
+    }
+'''
+
+APP_JS = '''
+    // State
+    let searchRunning = false;
+    let pollTimer = null;
+    
+    // Elements
+    const districtSelect = document.getElementById('district');
+    const talukSelect = document.getElementById('taluk');
+    const hobliSelect = document.getElementById('hobli');
+    const villageSelect = document.getElementById('village');
+    const searchBtn = document.getElementById('searchBtn');
+    const ownerInput = document.getElementById('ownerName');
+    const maxSurveyInput = document.getElementById('maxSurvey');
+
+    // Status worker - fetches /api/search/status off the main thread and
+    // hands the raw response bytes back via the transfer list (zero-copy),
+    // so the record payload is never structured-cloned between threads.
+    // Frames identical to the previous one are not sent at all: the worker
+    // fingerprints each body (length + FNV-1a) and only replies "unchanged".
+    const STATUS_WORKER_SRC = `
+        let lastLen = -1, lastHash = 0;
+        function fnv1a(bytes) {
+            let h = 0x811c9dc5;
+            for (let i = 0; i < bytes.length; i++) {
+                h ^= bytes[i];
+                h = Math.imul(h, 0x01000193);
+            }
+            return h >>> 0;
+        }
+        self.onmessage = async (e) => {
+            const id = e.data.id;
+            try {
+                const res = await fetch(e.data.url, {cache: 'no-store'});
+                const buf = await res.arrayBuffer();
+                const hash = fnv1a(new Uint8Array(buf));
+                if (buf.byteLength === lastLen && hash === lastHash) {
+                    self.postMessage({id, unchanged: true});
+                    return;
+                }
+                lastLen = buf.byteLength;
+                lastHash = hash;
+                self.postMessage({id, buf}, [buf]);
+            } catch (err) {
+                self.postMessage({id, buf: null});
+            }
+        };
+    `;
+    const statusUrl = location.origin + '/api/search/status';
+    const statusDecoder = new TextDecoder();
+    const statusPending = new Map();
+    let statusWorker = null;
+    let statusRequestId = 0;
+    let lastStatusFrame = null;
+
+    try {
+        const blobUrl = URL.createObjectURL(new Blob([STATUS_WORKER_SRC], {type: 'text/javascript'}));
+        statusWorker = new Worker(blobUrl);
+        statusWorker.onmessage = (e) => {
+            const pending = statusPending.get(e.data.id);
+            if (!pending) return;
+            statusPending.delete(e.data.id);
+            if (e.data.unchanged && lastStatusFrame) {
+                pending.resolve(lastStatusFrame);
+            } else if (e.data.buf) {
+                lastStatusFrame = JSON.parse(statusDecoder.decode(new Uint8Array(e.data.buf)));
+                pending.resolve(lastStatusFrame);
+            } else {
+                pending.reject(new Error('status fetch failed'));
+            }
+        };
+    } catch (e) {
+        statusWorker = null;  // Fall back to fetching on the main thread
+    }
+
+    // Cursors ask the server for only the log lines / record rows we lack
+    function fetchStatus() {
+        const url = `${statusUrl}?since=${recordsSeen}&logs_since=${logsSeen}`;
+        if (!statusWorker) {
+            return fetch(url).then(res => res.json());
+        }
+        return new Promise((resolve, reject) => {
+            const id = ++statusRequestId;
+            statusPending.set(id, {resolve, reject});
+            statusWorker.postMessage({id, url});
+        });
+    }
+
+    // Initialize
+    document.addEventListener('DOMContentLoaded', () => {
+        ensureWorkerCards(parseInt(document.getElementById('workersGrid').dataset.workers) || 4);
+        loadDistricts();
+        setupEventListeners();
+    });
+    
+    function setupEventListeners() {
+        districtSelect.addEventListener('change', () => {
+            const code = districtSelect.value;
+            if (code) loadTaluks(code);
+            else resetDropdowns(['taluk', 'hobli', 'village']);
+        });
+        
+        talukSelect.addEventListener('change', () => {
+            const distCode = districtSelect.value;
+            const talukCode = talukSelect.value;
+            if (talukCode) loadHoblis(distCode, talukCode);
+            else resetDropdowns(['hobli', 'village']);
+        });
+        
+        hobliSelect.addEventListener('change', () => {
+            const distCode = districtSelect.value;
+            const talukCode = talukSelect.value;
+            const hobliCode = hobliSelect.value;
+            if (hobliCode === 'all') {
+                villageSelect.innerHTML = '<option value="all">🔍 All Villages (All Hoblis)</option>';
+                villageSelect.disabled = false;
+            } else if (hobliCode) {
+                loadVillages(distCode, talukCode, hobliCode);
+            } else {
+                resetDropdowns(['village']);
+            }
+        });
+        
+        searchBtn.addEventListener('click', toggleSearch);
+        document.getElementById('matchesTable').addEventListener('scroll', onMatchesScroll, {passive: true});
+    }
+    
+    // Dropdown lists are static reference data: keep them in IndexedDB for
+    // LIST_CACHE_TTL, fill dropdowns from there and revalidate in background
+    const LIST_CACHE_TTL = 7 * 24 * 3600 * 1000;
+    let listCacheDb = null;
+    
+    function openListCache() {
+        if (!listCacheDb) {
+            listCacheDb = new Promise(resolve => {
+                try {
+                    const req = indexedDB.open('power-bhoomi', 1);
+                    req.onupgradeneeded = () => req.result.createObjectStore('lists');
+                    req.onsuccess = () => resolve(req.result);
+                    req.onerror = () => resolve(null);
+                } catch (e) {
+                    resolve(null);  // IndexedDB unavailable (private mode etc.)
+                }
+            });
+        }
+        return listCacheDb;
+    }
+    
+    async function listCacheGet(url) {
+        const db = await openListCache();
+        if (!db) return null;
+        return new Promise(resolve => {
+            try {
+                const req = db.transaction('lists').objectStore('lists').get(url);
+                req.onsuccess = () => {
+                    const entry = req.result;
+                    resolve(entry && Date.now() - entry.ts < LIST_CACHE_TTL ? entry.data : null);
+                };
+                req.onerror = () => resolve(null);
+            } catch (e) {
+                resolve(null);
+            }
+        });
+    }
+    
+    async function listCacheSet(url, data) {
+        // Empty lists are what the server returns on upstream errors
+        if (!Array.isArray(data) || !data.length) return;
+        const db = await openListCache();
+        if (!db) return;
+        try {
+            db.transaction('lists', 'readwrite').objectStore('lists').put({data, ts: Date.now()}, url);
+        } catch (e) {}
+    }
+    
+    async function fetchList(url) {
+        const res = await fetch(url);
+        if (!res.ok) throw new Error(res.status);
+        const data = await res.json();
+        listCacheSet(url, data);
+        return data;
+    }
+    
+    // Render from cache if possible, then again only if the fresh list differs
+    async function loadList(url, render) {
+        const cached = await listCacheGet(url);
+        if (cached) render(cached);
+        const fresh = fetchList(url).then(data => {
+            if (!cached || JSON.stringify(cached) !== JSON.stringify(data)) render(data);
+        });
+        if (cached) fresh.catch(() => {});
+        else await fresh;
+    }
+    
+    async function loadDistricts() {
+        try {
+            await loadList('/api/districts', data => {
+                fillSelect(districtSelect, [['Select District', '']], data, 'district_code', 'district_name_kn');
+            });
+        } catch (e) {
+            districtSelect.innerHTML = '<option value="">Error loading</option>';
+        }
+    }
+    
+    async function loadTaluks(distCode) {
+        resetDropdowns(['taluk', 'hobli', 'village']);
+        talukSelect.innerHTML = '<option value="">Loading...</option>';
+        try {
+            await loadList(`/api/taluks/${distCode}`, data => {
+                if (districtSelect.value !== String(distCode)) return;
+                fillSelect(talukSelect, [['Select Taluk', '']], data, 'taluka_code', 'taluka_name_kn');
+                talukSelect.disabled = false;
+            });
+        } catch (e) {}
+    }
+    
+    async function loadHoblis(distCode, talukCode) {
+        resetDropdowns(['hobli', 'village']);
+        hobliSelect.innerHTML = '<option value="">Loading...</option>';
+        try {
+            await loadList(`/api/hoblis/${distCode}/${talukCode}`, data => {
+                if (talukSelect.value !== String(talukCode)) return;
+                fillSelect(hobliSelect, [
+                    ['Select Hobli', ''],
+                    ['🔍 All Hoblis (Search Entire Taluk)', 'all']
+                ], data, 'hobli_code', 'hobli_name_kn');
+                hobliSelect.disabled = false;
+                prefetchVillages(distCode, talukCode, data.map(h => h.hobli_code));
+            });
+        } catch (e) {}
+    }
+    
+    // Village lists keyed by dist/taluk/hobli. Entries are promises so a
+    // prefetch still in flight is shared with the user's actual selection.
+    // Lists found in IndexedDB are used as-is until LIST_CACHE_TTL expires;
+    // revalidating them would turn every prefetch into a burst of requests.
+    const villageCache = new Map();
+    const PREFETCH_CONCURRENCY = Math.min(3, navigator.hardwareConcurrency || 3);
+    
+    function getVillages(distCode, talukCode, hobliCode) {
+        const key = `${distCode}/${talukCode}/${hobliCode}`;
+        if (!villageCache.has(key)) {
+            const url = `/api/villages/${key}`;
+            const pending = listCacheGet(url)
+                .then(cached => cached || fetchList(url))
+                .catch(e => {
+                    villageCache.delete(key);
+                    throw e;
+                });
+            villageCache.set(key, pending);
+        }
+        return villageCache.get(key);
+    }
+    
+    // Warm the village lists while the user is still picking a hobli
+    function prefetchVillages(distCode, talukCode, hobliCodes) {
+        const queue = hobliCodes.slice();
+        const next = () => {
+            if (!queue.length || talukSelect.value !== String(talukCode)) return;
+            getVillages(distCode, talukCode, queue.shift()).catch(() => {}).then(next);
+        };
+        for (let i = 0; i < PREFETCH_CONCURRENCY; i++) next();
+    }
+    
+    async function loadVillages(distCode, talukCode, hobliCode) {
+        resetDropdowns(['village']);
+        villageSelect.innerHTML = '<option value="">Loading...</option>';
+        try {
+            const data = await getVillages(distCode, talukCode, hobliCode);
+            fillSelect(villageSelect, [
+                ['Select Village', ''],
+                ['🔍 All Villages (in this Hobli)', 'all']
+            ], data, 'village_code', 'village_name_kn');
+            villageSelect.disabled = false;
+        } catch (e) {}
+    }
+    
+    // Build all <option>s in a fragment and swap them in once, instead of
+    // re-parsing the growing innerHTML string for every item
+    function fillSelect(select, leading, items, codeKey, nameKey) {
+        const frag = document.createDocumentFragment();
+        leading.forEach(([label, value]) => frag.appendChild(new Option(label, value)));
+        items.forEach(item => frag.appendChild(new Option(item[nameKey] || item[codeKey], item[codeKey])));
+        const previous = select.value;
+        select.replaceChildren(frag);
+        if (previous && items.some(item => String(item[codeKey]) === previous)) {
+            select.value = previous;  // Background refresh keeps the user's pick
+        }
+    }
+    
+    function resetDropdowns(ids) {
+        ids.forEach(id => {
+            const el = document.getElementById(id);
+            el.innerHTML = `<option value="">Select ${id} first</option>`;
+            el.disabled = true;
+        });
+    }
+    
+    async function toggleSearch() {
+        if (searchRunning) {
+            await stopSearch();
+        } else {
+            await startSearch();
+        }
+    }
+    
+    async function startSearch() {
+        const ownerName = ownerInput.value.trim();
+        if (!ownerName) {
+            alert('Please enter an owner name');
+            return;
+        }
+        
+        const districtCode = districtSelect.value;
+        const talukCode = talukSelect.value;
+        const hobliCode = hobliSelect.value || 'all';
+        const villageCode = villageSelect.value || 'all';
+        
+        if (!districtCode || !talukCode) {
+            alert('Please select District and Taluk');
+            return;
+        }
+        
+        searchRunning = true;
+        logsSeen = 0;
+        lastStatus = null;
+        lastWorker = {};
+        lastPolled = null;
+        resetResultTables();
+        searchBtn.innerHTML = '<span class="spinner"></span><span>Stop Search</span>';
+        searchBtn.classList.add('btn-stop');
+        document.getElementById('progressSection').style.display = 'block';
+        
+        addLog('🚀 Starting parallel search...');
+        
+        try {
+            await fetch('/api/search/start', {
+                method: 'POST',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify({
+                    owner_name: ownerName,
+                    district_code: districtCode,
+                    taluk_code: talukCode,
+                    hobli_code: hobliCode,
+                    village_code: villageCode,
+                    max_survey: parseInt(maxSurveyInput.value) || 200
+                })
+            });
+            
+            pollDelay = POLL_MIN_DELAY;
+            if (!openStatusStream()) schedulePoll();
+        } catch (e) {
+            addLog('❌ Error starting search');
+            stopSearch();
+        }
+    }
+    
+    async function stopSearch() {
+        try {
+            await fetch('/api/search/stop', {method: 'POST'});
+        } catch (e) {}
+        
+        searchRunning = false;
+        searchBtn.innerHTML = '<span>⚡</span><span>Start Parallel Search</span>';
+        searchBtn.classList.remove('btn-stop');
+        
+        closeStatusStream();
+        if (pollTimer) {
+            clearTimeout(pollTimer);
+            pollTimer = null;
+        }
+    }
+    
+    // Poll quickly while the search is producing output and back off
+    // (up to POLL_MAX_DELAY) while nothing changes between polls
+    const POLL_MIN_DELAY = 1000;
+    const POLL_MAX_DELAY = 10000;
+    let pollDelay = POLL_MIN_DELAY;
+    
+    async function schedulePoll() {
+        pollTimer = null;
+        const changed = await pollStatus();
+        if (!searchRunning) return;
+        pollDelay = changed ? POLL_MIN_DELAY : Math.min(pollDelay * 1.5, POLL_MAX_DELAY);
+        pollTimer = setTimeout(schedulePoll, pollDelay);
+    }
+    
+    // Append worker cards until there are `count` of them
+    function ensureWorkerCards(count) {
+        const grid = document.getElementById('workersGrid');
+        let html = '';
+        for (let id = grid.childElementCount; id < count; id++) {
+            html += `
+                <div class="worker-card" id="worker-${id}">
+                    <div class="worker-header">
+                        <span class="worker-id">🖥️ Worker ${id + 1}</span>
+                        <span class="worker-status idle">Idle</span>
+                    </div>
+                    <div class="worker-village">Waiting to start...</div>
+                    <div class="worker-progress"><div class="worker-progress-fill" style="width: 0%"></div></div>
+                    <div class="worker-stats"><span>0/0 villages</span><span>0 records</span></div>
+                </div>`;
+        }
+        if (html) grid.insertAdjacentHTML('beforeend', html);
+    }
+    
+    // Last values written to the DOM, so unchanged ticks cost no writes
+    const OVERVIEW_FIELDS = ['progress', 'villages_completed', 'total_villages', 'total_records', 'total_matches', 'active_workers'];
+    const WORKER_FIELDS = ['status', 'progress', 'current_village', 'records_found', 'villages_completed', 'villages_total'];
+    let lastStatus = null;
+    let lastWorker = {};
+    let lastPolled = null;
+    const PROGRESS_FIELDS = ['logs_total', 'total_records', 'villages_completed', 'active_workers', 'running'];
+    
+    async function pollStatus() {
+        try {
+            return applyStatus(await fetchStatus());
+        } catch (e) {
+            return false;
+        }
+    }
+    
+    // Push updates over Server-Sent Events; polling is the fallback when
+    // EventSource is missing or the stream cannot be established
+    let statusStream = null;
+    
+    function openStatusStream() {
+        if (!window.EventSource) return false;
+        statusStream = new EventSource('/api/search/stream');
+        statusStream.onmessage = (e) => applyStatus(JSON.parse(e.data));
+        statusStream.onerror = () => {
+            if (statusStream && statusStream.readyState === EventSource.CLOSED) {
+                closeStatusStream();
+                if (searchRunning && !pollTimer) schedulePoll();
+            }
+        };
+        return true;
+    }
+    
+    function closeStatusStream() {
+        if (statusStream) {
+            statusStream.close();
+            statusStream = null;
+        }
+    }
+    
+    // Render a status frame (full or delta); returns true when it moved
+    // since the previous frame
+    function applyStatus(status) {
+        try {
+            const changed = !lastPolled || PROGRESS_FIELDS.some(k => lastPolled[k] !== status[k]);
+            lastPolled = status;
+
+            // Update overall progress (only when one of the numbers moved)
+            if (!lastStatus || OVERVIEW_FIELDS.some(k => lastStatus[k] !== status[k])) {
+                document.getElementById('progressPercent').textContent = status.progress + '%';
+                document.getElementById('progressFill').style.width = status.progress + '%';
+                document.getElementById('villagesCompleted').textContent = `${status.villages_completed}/${status.total_villages}`;
+                document.getElementById('totalRecords').textContent = status.total_records;
+                document.getElementById('totalMatches').textContent = status.total_matches;
+                document.getElementById('activeWorkers').textContent = status.active_workers;
+                
+                // Update badges
+                document.getElementById('recordsBadge').textContent = status.total_records;
+                document.getElementById('matchesBadge').textContent = status.total_matches;
+                
+                lastStatus = status;
+            }
+            
+            // Update workers, skipping cards whose values did not change
+            if (status.workers) {
+                ensureWorkerCards(status.total_workers || 0);
+                Object.entries(status.workers).forEach(([id, w]) => {
+                    const prev = lastWorker[id];
+                    if (prev && WORKER_FIELDS.every(k => prev[k] === w[k])) return;
+                    const card = document.getElementById(`worker-${id}`);
+                    if (card) {
+                        lastWorker[id] = { ...w };
+                        card.querySelector('.worker-status').textContent = w.status;
+                        card.querySelector('.worker-status').className = `worker-status ${w.status}`;
+                        card.querySelector('.worker-village').textContent = w.current_village || 'Waiting...';
+                        card.querySelector('.worker-progress-fill').style.width = w.progress + '%';
+                        card.querySelector('.worker-stats').innerHTML = 
+                            `<span>${w.villages_completed}/${w.villages_total} villages</span><span>${w.records_found} records</span>`;
+                    }
+                });
+            }
+            
+            // Update records tables (real-time)
+            if (status.all_records) {
+                appendRecordRows(status.all_records, status.all_records_total || 0);
+            }
+            
+            // Update logs (only lines we have not rendered yet)
+            if (status.logs) {
+                appendServerLogs(status.logs, status.logs_total || 0);
+            }
+            
+            // Check if completed
+            if (status.completed || !status.running) {
+                addLog('✅ Search completed!');
+                stopSearch();
+            }
+            
+            return changed;
+        } catch (e) {
+            return false;
+        }
+    }
+    
+    // Server log lines already rendered; the log panel keeps at most
+    // MAX_LOG_ENTRIES nodes, dropping the oldest ones first
+    const MAX_LOG_ENTRIES = 500;
+    let logsSeen = 0;
+    
+    function appendServerLogs(logs, total) {
+        if (total < logsSeen) logsSeen = 0;  // Server restarted its counter
+        const fresh = Math.min(total - logsSeen, logs.length);
+        logsSeen = total;
+        if (fresh <= 0) return;
+        
+        logs.slice(logs.length - fresh).forEach(appendLogEntry);
+    }
+    
+    // The container is column-reverse, so appending puts the line on top
+    function appendLogEntry(text) {
+        const container = document.getElementById('logsContainer');
+        const entry = document.createElement('div');
+        entry.className = 'log-entry';
+        entry.textContent = text;
+        container.appendChild(entry);
+        while (container.childElementCount > MAX_LOG_ENTRIES) {
+            container.removeChild(container.firstChild);
+        }
+    }
+    
+    function addLog(message) {
+        appendLogEntry(new Date().toLocaleTimeString() + ' - ' + message);
+    }
+    
+    // Tab switching
+    let currentTab = 'records';
+    
+    function switchTab(tab) {
+        currentTab = tab;
+        
+        // Update tab buttons
+        document.getElementById('tabRecords').classList.toggle('active', tab === 'records');
+        document.getElementById('tabMatches').classList.toggle('active', tab === 'matches');
+        
+        // Show/hide tables
+        document.getElementById('recordsTable').style.display = tab === 'records' ? 'block' : 'none';
+        document.getElementById('matchesTable').style.display = tab === 'matches' ? 'block' : 'none';
+        if (tab === 'matches') renderMatchesWindow();  // Viewport size is known now
+    }
+    
+    // Record rows are [village, survey_no, hissa, owner_name, extent,
+    // khatah, worker_id, is_match]; matches are the flagged rows
+    const RECENT_RECORD_ROWS = 50;
+    let matchRows = [];
+    let recordsSeen = 0;
+    
+    // Rows that arrived since the last paint; the tables are redrawn at most
+    // once per animation frame however fast status updates come in
+    let pendingRecordRows = [];
+    let matchesDirty = false;
+    let tablesFrame = 0;
+    
+    function appendRecordRows(rows, total) {
+        if (total < recordsSeen) recordsSeen = 0;  // Server restarted its counter
+        const fresh = Math.min(total - recordsSeen, rows.length);
+        recordsSeen = total;
+        if (fresh <= 0) return;
+        
+        const added = rows.slice(rows.length - fresh);
+        pendingRecordRows.push(...added);
+        if (pendingRecordRows.length > RECENT_RECORD_ROWS) {
+            pendingRecordRows = pendingRecordRows.slice(-RECENT_RECORD_ROWS);
+        }
+        
+        const addedMatches = added.filter(r => r[7]);
+        if (addedMatches.length) {
+            matchRows.push(...addedMatches);
+            matchesDirty = true;
+        }
+        if (!tablesFrame) tablesFrame = requestAnimationFrame(flushResultTables);
+    }
+    
+    function flushResultTables() {
+        tablesFrame = 0;
+        if (pendingRecordRows.length) {
+            updateRecordsTable(pendingRecordRows);
+            pendingRecordRows = [];
+        }
+        if (matchesDirty) {
+            matchesDirty = false;
+            updateMatchesTable(matchRows);
+        }
+    }
+    
+    function resetResultTables() {
+        if (tablesFrame) cancelAnimationFrame(tablesFrame);
+        tablesFrame = 0;
+        pendingRecordRows = [];
+        matchesDirty = false;
+        matchRows = [];
+        recordsSeen = 0;
+        document.getElementById('recordsBody').innerHTML = '<tr><td colspan="6" class="empty-row">No records yet. Start a search to see results.</td></tr>';
+        updateMatchesTable(matchRows);
+    }
+    
+    // 'W<id>' labels for the worker column, built once per worker id
+    const workerLabels = [];
+    
+    function workerLabel(id) {
+        id = id || 0;
+        return workerLabels[id] || (workerLabels[id] = 'W' + id);
+    }
+    
+    // Update records table: put the new rows on top and drop rows past
+    // RECENT_RECORD_ROWS, leaving existing row nodes untouched
+    function updateRecordsTable(added) {
+        const tbody = document.getElementById('recordsBody');
+        if (tbody.querySelector('.empty-row')) tbody.replaceChildren();
+        
+        const frag = document.createDocumentFragment();
+        added.slice(-RECENT_RECORD_ROWS).reverse().forEach(r => {
+            const tr = document.createElement('tr');
+            [r[0], r[1], r[2], r[3], r[4], workerLabel(r[6])].forEach((value, i) => {
+                const td = tr.insertCell();
+                td.textContent = value || '';
+                if (i === 3) td.className = 'owner-cell kannada';
+            });
+            frag.appendChild(tr);
+        });
+        tbody.insertBefore(frag, tbody.firstChild);
+        while (tbody.rows.length > RECENT_RECORD_ROWS) {
+            tbody.deleteRow(-1);
+        }
+    }
+    
+    // Matches table is virtualized: matchRows is unbounded, so only the rows
+    // in view (plus MATCH_OVERSCAN either side) exist in the DOM and two
+    // spacer rows stand in for the rest
+    const MATCH_OVERSCAN = 8;
+    let matchRowHeight = 40;  // Re-measured from a rendered row
+    let matchScrollQueued = false;
+    
+    function updateMatchesTable(matches) {
+        const tbody = document.getElementById('matchesBody');
+        if (!matches || matches.length === 0) {
+            tbody.innerHTML = '<tr><td colspan="6" class="empty-row">No matches found yet.</td></tr>';
+            return;
+        }
+        renderMatchesWindow();
+    }
+    
+    function spacerRow(height) {
+        return height > 0 ? `<tr class="spacer-row" style="height: ${height}px"><td colspan="6"></td></tr>` : '';
+    }
+    
+    const HTML_ESCAPES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+    
+    function escapeHtml(value) {
+        if (value == null) return '';
+        const text = String(value);
+        return /[&<>"']/.test(text) ? text.replace(/[&<>"']/g, ch => HTML_ESCAPES[ch]) : text;
+    }
+    
+    // Constant markup around the six cells of a match row
+    const MATCH_ROW_FRAGMENTS = [
+        '<tr class="match-row"><td>', '</td><td>', '</td><td>',
+        '</td><td class="owner-cell match kannada">', '</td><td>', '</td><td>', '</td></tr>'
+    ];
+    
+    function renderMatchesWindow() {
+        if (!matchRows.length) return;
+        const container = document.getElementById('matchesTable');
+        const tbody = document.getElementById('matchesBody');
+        const viewport = container.clientHeight || 350;  // Hidden tab has no height
+        const total = matchRows.length;
+        const start = Math.max(0, Math.floor(container.scrollTop / matchRowHeight) - MATCH_OVERSCAN);
+        const end = Math.min(total, start + Math.ceil(viewport / matchRowHeight) + 2 * MATCH_OVERSCAN);
+        
+        const f = MATCH_ROW_FRAGMENTS;
+        const parts = [spacerRow(start * matchRowHeight)];
+        for (let i = start; i < end; i++) {
+            const r = matchRows[i];
+            parts.push(f[0], escapeHtml(r[0]), f[1], escapeHtml(r[1]), f[2], escapeHtml(r[2]),
+                       f[3], escapeHtml(r[3]), f[4], escapeHtml(r[4]), f[5], escapeHtml(r[5]), f[6]);
+        }
+        parts.push(spacerRow((total - end) * matchRowHeight));
+        tbody.innerHTML = parts.join('');
+        
+        const firstRow = tbody.querySelector('tr.match-row');
+        if (firstRow && firstRow.offsetHeight) matchRowHeight = firstRow.offsetHeight;
+    }
+    
+    function onMatchesScroll() {
+        if (matchScrollQueued) return;
+        matchScrollQueued = true;
+        requestAnimationFrame(() => {
+            matchScrollQueued = false;
+            renderMatchesWindow();
+        });
+    }
+    
+    // Download Modal Functions
+    async function showDownloadModal() {
+        // Fetch file info
+        try {
+            const res = await fetch('/api/files/info');
+            const info = await res.json();
+            
+            // Update records card
+            document.getElementById('recordsCount').textContent = `${info.all_records.count} records`;
+            document.getElementById('recordsPath').textContent = info.all_records.filename || 'No file yet';
+            document.getElementById('recordsFilename').value = info.all_records.filename || 'all_records.csv';
+            
+            // Update matches card
+            document.getElementById('matchesCount').textContent = `${info.matches.count} matches`;
+            document.getElementById('matchesPath').textContent = info.matches.filename || 'No file yet';
+            document.getElementById('matchesFilename').value = info.matches.filename || 'owner_matches.csv';
+            
+            // Enable/disable download buttons
+            const recordsBtn = document.querySelector('#recordsDownloadCard .btn-download');
+            const matchesBtn = document.querySelector('#matchesDownloadCard .btn-download');
+            
+            recordsBtn.disabled = !info.all_records.exists;
+            matchesBtn.disabled = !info.matches.exists;
+            
+        } catch (e) {
+            console.error('Error fetching file info:', e);
+        }
+        
+        // Show modal
+        document.getElementById('downloadModal').style.display = 'flex';
+    }
+    
+    function hideDownloadModal() {
+        document.getElementById('downloadModal').style.display = 'none';
+    }
+    
+    function downloadFile(fileType) {
+        let filename;
+        if (fileType === 'records') {
+            filename = document.getElementById('recordsFilename').value || 'all_records.csv';
+        } else {
+            filename = document.getElementById('matchesFilename').value || 'owner_matches.csv';
+        }
+        
+        // Ensure .csv extension
+        if (!filename.endsWith('.csv')) {
+            filename += '.csv';
+        }
+        
+        // Trigger download via a transient link: the browser saves the
+        // streamed response straight to disk and the page is not navigated
+        const link = document.createElement('a');
+        link.href = `/api/download/${fileType}?filename=${encodeURIComponent(filename)}`;
+        link.download = filename;
+        document.body.appendChild(link);
+        link.click();
+        link.remove();
+        
+        addLog(`📥 Downloaded: ${filename}`);
+    }
+    
+    // Close modal on Escape key
+    document.addEventListener('keydown', (e) => {
+        if (e.key === 'Escape') {
+            hideDownloadModal();
+        }
+    });
+'''
+
+# Content hash used as the ?v= cache-buster, so assets can be cached forever
+ASSET_VERSION = hashlib.sha1((APP_CSS + APP_JS).encode('utf-8')).hexdigest()[:12]
+ASSET_MAX_AGE = 31536000  # One year
+
+def _minify_asset(source: str, comment_re: str) -> str:
+    """Drop comments, indentation and blank lines; line breaks are kept (JS ASI)"""
+    source = re.sub(comment_re, '', source)
+    return '\n'.join(line.strip() for line in source.splitlines() if line.strip())
+
+def _build_asset(body: bytes, mimetype: str) -> dict:
+    """Keep identity/gzip/brotli encodings of a constant response body"""
+    variants = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9)}
+    if brotli is not None:
+        variants['br'] = brotli.compress(body, quality=11)
+    return {'mimetype': mimetype, 'variants': variants}
+
+# CSS: /* block */ comments; JS: only whole-line // comments, which cannot
+# sit inside a string or regex literal
+STATIC_ASSETS = {
+    'app.css': _build_asset(_minify_asset(APP_CSS, r'/\*.*?\*/').encode('utf-8'), 'text/css'),
+    'app.js': _build_asset(_minify_asset(APP_JS, r'(?m)^[ \t]*//.*$').encode('utf-8'), 'application/javascript'),
+}
+
+# ═══════════════════════════════════════════════════════════════════════════════════════
+# HTML TEMPLATE (Enhanced with parallel worker visualization)
+# ═══════════════════════════════════════════════════════════════════════════════════════
+
+HTML_TEMPLATE = '''
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>POWER-BHOOMI v3.0 | Bulletproof Edition</title>
+    <link href="https://fonts.googleapis.com/css2?family=Outfit:wght@300;400;500;600;700&family=Noto+Sans+Kannada:wght@400;500;600;700&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
+    <link rel="stylesheet" href="/assets/app.css?v={{ asset_version }}">
+</head>
+<body>
+    <header class="header">
+        <div class="header-content">
+            <div class="logo">
+                <div class="logo-icon">⚡</div>
+                <div class="logo-text">
+                    <h1>POWER-BHOOMI</h1>
+                    <p>Parallel Search Engine</p>
+                </div>
+            </div>
+            <div class="version-badge">v3.0 🛡️ Bulletproof • 4 Workers</div>
+        </div>
+    </header>
+    
+    <main class="main-container">
+        <aside class="card">
+            <h2 class="card-title">Search Configuration</h2>
+            
+            <div class="form-group">
+                <label class="form-label">Owner Name <span class="kannada">(ಮಾಲೀಕರ ಹೆಸರು)</span></label>
+                <input type="text" id="ownerName" class="form-input kannada" placeholder="Enter owner name...">
+            </div>
+            
+            <div class="form-group">
+                <label class="form-label">District <span class="kannada">(ಜಿಲ್ಲೆ)</span></label>
+                <select id="district" class="form-select">
+                    <option value="">Loading...</option>
+                </select>
+            </div>
+            
+            <div class="form-group">
+                <label class="form-label">Taluk <span class="kannada">(ತಾಲೂಕು)</span></label>
+                <select id="taluk" class="form-select" disabled>
+                    <option value="">Select district first</option>
                 </select>
             </div>
             
@@ -2866,44 +4785,8 @@ HTML_TEMPLATE = '''
                 
                 <!-- Workers Grid -->
                 <h3 class="card-title" style="margin-top: 1rem;">Browser Workers</h3>
-                <div class="workers-grid" id="workersGrid">
-                    <div class="worker-card" id="worker-0">
-                        <div class="worker-header">
-                            <span class="worker-id">🖥️ Worker 1</span>
-                            <span class="worker-status idle">Idle</span>
-                        </div>
-                        <div class="worker-village">Waiting to start...</div>
-                        <div class="worker-progress"><div class="worker-progress-fill" style="width: 0%"></div></div>
-                        <div class="worker-stats"><span>0/0 villages</span><span>0 records</span></div>
-                    </div>
-                    <div class="worker-card" id="worker-1">
-                        <div class="worker-header">
-                            <span class="worker-id">🖥️ Worker 2</span>
-                            <span class="worker-status idle">Idle</span>
-                        </div>
-                        <div class="worker-village">Waiting to start...</div>
-                        <div class="worker-progress"><div class="worker-progress-fill" style="width: 0%"></div></div>
-                        <div class="worker-stats"><span>0/0 villages</span><span>0 records</span></div>
-                    </div>
-                    <div class="worker-card" id="worker-2">
-                        <div class="worker-header">
-                            <span class="worker-id">🖥️ Worker 3</span>
-                            <span class="worker-status idle">Idle</span>
-                        </div>
-                        <div class="worker-village">Waiting to start...</div>
-                        <div class="worker-progress"><div class="worker-progress-fill" style="width: 0%"></div></div>
-                        <div class="worker-stats"><span>0/0 villages</span><span>0 records</span></div>
-                    </div>
-                    <div class="worker-card" id="worker-3">
-                        <div class="worker-header">
-                            <span class="worker-id">🖥️ Worker 4</span>
-                            <span class="worker-status idle">Idle</span>
-                        </div>
-                        <div class="worker-village">Waiting to start...</div>
-                        <div class="worker-progress"><div class="worker-progress-fill" style="width: 0%"></div></div>
-                        <div class="worker-stats"><span>0/0 villages</span><span>0 records</span></div>
-                    </div>
-                </div>
+                <!-- Worker cards are built by ensureWorkerCards() -->
+                <div class="workers-grid" id="workersGrid" data-workers="{{ max_workers }}"></div>
             </div>
             
             <!-- Records Table with Tabs -->
@@ -3019,553 +4902,7 @@ HTML_TEMPLATE = '''
         </div>
     </div>
     
-    <style>
-        /* Modal Styles */
-        .modal {
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            z-index: 1000;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }
-        
-        .modal-overlay {
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.7);
-            backdrop-filter: blur(4px);
-        }
-        
-        .modal-content {
-            position: relative;
-            background: var(--bg-card);
-            border-radius: 16px;
-            border: 1px solid var(--border-color);
-            width: 90%;
-            max-width: 550px;
-            box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5);
-            animation: modalSlideIn 0.3s ease;
-        }
-        
-        @keyframes modalSlideIn {
-            from { opacity: 0; transform: translateY(-20px); }
-            to { opacity: 1; transform: translateY(0); }
-        }
-        
-        .modal-header {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 1.25rem 1.5rem;
-            border-bottom: 1px solid var(--border-color);
-        }
-        
-        .modal-header h3 {
-            margin: 0;
-            font-size: 1.2rem;
-            color: var(--text-primary);
-        }
-        
-        .modal-close {
-            background: none;
-            border: none;
-            color: var(--text-muted);
-            font-size: 1.5rem;
-            cursor: pointer;
-            padding: 0;
-            line-height: 1;
-        }
-        
-        .modal-close:hover { color: var(--text-primary); }
-        
-        .modal-body {
-            padding: 1.5rem;
-        }
-        
-        .download-section {
-            display: flex;
-            flex-direction: column;
-            gap: 1rem;
-        }
-        
-        .download-card {
-            background: var(--bg-secondary);
-            border: 1px solid var(--border-color);
-            border-radius: 12px;
-            padding: 1.25rem;
-            display: grid;
-            grid-template-columns: auto 1fr auto;
-            gap: 1rem;
-            align-items: center;
-        }
-        
-        .download-card.match-card {
-            border-color: var(--success);
-            background: rgba(16, 185, 129, 0.05);
-        }
-        
-        .download-icon {
-            font-size: 2rem;
-            width: 50px;
-            height: 50px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            background: var(--bg-input);
-            border-radius: 10px;
-        }
-        
-        .download-info h4 {
-            margin: 0 0 0.25rem 0;
-            color: var(--text-primary);
-            font-size: 1rem;
-        }
-        
-        .download-info p {
-            margin: 0;
-            color: var(--text-secondary);
-            font-size: 0.85rem;
-        }
-        
-        .file-path {
-            font-size: 0.75rem !important;
-            color: var(--text-muted) !important;
-            font-family: monospace;
-            word-break: break-all;
-        }
-        
-        .download-actions {
-            display: flex;
-            flex-direction: column;
-            gap: 0.5rem;
-        }
-        
-        .filename-input {
-            padding: 0.5rem 0.75rem;
-            background: var(--bg-input);
-            border: 1px solid var(--border-color);
-            border-radius: 6px;
-            color: var(--text-primary);
-            font-size: 0.85rem;
-            width: 160px;
-        }
-        
-        .filename-input:focus {
-            outline: none;
-            border-color: var(--accent-primary);
-        }
-        
-        .btn-download {
-            padding: 0.5rem 1rem;
-            background: var(--accent-primary);
-            color: var(--bg-primary);
-            border: none;
-            border-radius: 6px;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.2s;
-        }
-        
-        .btn-download:hover { background: var(--accent-hover); }
-        .btn-download.match-btn { background: var(--success); }
-        .btn-download.match-btn:hover { background: #059669; }
-        .btn-download:disabled { opacity: 0.5; cursor: not-allowed; }
-        
-        .modal-note {
-            margin-top: 1rem;
-            padding: 0.75rem 1rem;
-            background: rgba(245, 158, 11, 0.1);
-            border-radius: 8px;
-            border-left: 3px solid var(--accent-primary);
-        }
-        
-        .modal-note p {
-            margin: 0;
-            font-size: 0.85rem;
-            color: var(--text-secondary);
-        }
-    </style>
-    
-    <script>
-        // State
-        let searchRunning = false;
-        let pollInterval = null;
-        
-        // Elements
-        const districtSelect = document.getElementById('district');
-        const talukSelect = document.getElementById('taluk');
-        const hobliSelect = document.getElementById('hobli');
-        const villageSelect = document.getElementById('village');
-        const searchBtn = document.getElementById('searchBtn');
-        const ownerInput = document.getElementById('ownerName');
-        const maxSurveyInput = document.getElementById('maxSurvey');
-        
-        // Initialize
-        document.addEventListener('DOMContentLoaded', () => {
-            loadDistricts();
-            setupEventListeners();
-        });
-        
-        function setupEventListeners() {
-            districtSelect.addEventListener('change', () => {
-                const code = districtSelect.value;
-                if (code) loadTaluks(code);
-                else resetDropdowns(['taluk', 'hobli', 'village']);
-            });
-            
-            talukSelect.addEventListener('change', () => {
-                const distCode = districtSelect.value;
-                const talukCode = talukSelect.value;
-                if (talukCode) loadHoblis(distCode, talukCode);
-                else resetDropdowns(['hobli', 'village']);
-            });
-            
-            hobliSelect.addEventListener('change', () => {
-                const distCode = districtSelect.value;
-                const talukCode = talukSelect.value;
-                const hobliCode = hobliSelect.value;
-                if (hobliCode === 'all') {
-                    villageSelect.innerHTML = '<option value="all">🔍 All Villages (All Hoblis)</option>';
-                    villageSelect.disabled = false;
-                } else if (hobliCode) {
-                    loadVillages(distCode, talukCode, hobliCode);
-                } else {
-                    resetDropdowns(['village']);
-                }
-            });
-            
-            searchBtn.addEventListener('click', toggleSearch);
-        }
-        
-        async function loadDistricts() {
-            try {
-                const res = await fetch('/api/districts');
-                const data = await res.json();
-                districtSelect.innerHTML = '<option value="">Select District</option>';
-                data.forEach(d => {
-                    const name = d.district_name_kn || d.district_code;
-                    districtSelect.innerHTML += `<option value="${d.district_code}">${name}</option>`;
-                });
-            } catch (e) {
-                districtSelect.innerHTML = '<option value="">Error loading</option>';
-            }
-        }
-        
-        async function loadTaluks(distCode) {
-            resetDropdowns(['taluk', 'hobli', 'village']);
-            talukSelect.innerHTML = '<option value="">Loading...</option>';
-            try {
-                const res = await fetch(`/api/taluks/${distCode}`);
-                const data = await res.json();
-                talukSelect.innerHTML = '<option value="">Select Taluk</option>';
-                data.forEach(t => {
-                    const name = t.taluka_name_kn || t.taluka_code;
-                    talukSelect.innerHTML += `<option value="${t.taluka_code}">${name}</option>`;
-                });
-                talukSelect.disabled = false;
-            } catch (e) {}
-        }
-        
-        async function loadHoblis(distCode, talukCode) {
-            resetDropdowns(['hobli', 'village']);
-            hobliSelect.innerHTML = '<option value="">Loading...</option>';
-            try {
-                const res = await fetch(`/api/hoblis/${distCode}/${talukCode}`);
-                const data = await res.json();
-                hobliSelect.innerHTML = '<option value="">Select Hobli</option>';
-                hobliSelect.innerHTML += '<option value="all">🔍 All Hoblis (Search Entire Taluk)</option>';
-                data.forEach(h => {
-                    const name = h.hobli_name_kn || h.hobli_code;
-                    hobliSelect.innerHTML += `<option value="${h.hobli_code}">${name}</option>`;
-                });
-                hobliSelect.disabled = false;
-            } catch (e) {}
-        }
-        
-        async function loadVillages(distCode, talukCode, hobliCode) {
-            resetDropdowns(['village']);
-            villageSelect.innerHTML = '<option value="">Loading...</option>';
-            try {
-                const res = await fetch(`/api/villages/${distCode}/${talukCode}/${hobliCode}`);
-                const data = await res.json();
-                villageSelect.innerHTML = '<option value="">Select Village</option>';
-                villageSelect.innerHTML += '<option value="all">🔍 All Villages (in this Hobli)</option>';
-                data.forEach(v => {
-                    const name = v.village_name_kn || v.village_code;
-                    villageSelect.innerHTML += `<option value="${v.village_code}">${name}</option>`;
-                });
-                villageSelect.disabled = false;
-            } catch (e) {}
-        }
-        
-        function resetDropdowns(ids) {
-            ids.forEach(id => {
-                const el = document.getElementById(id);
-                el.innerHTML = `<option value="">Select ${id} first</option>`;
-                el.disabled = true;
-            });
-        }
-        
-        async function toggleSearch() {
-            if (searchRunning) {
-                await stopSearch();
-            } else {
-                await startSearch();
-            }
-        }
-        
-        async function startSearch() {
-            const ownerName = ownerInput.value.trim();
-            if (!ownerName) {
-                alert('Please enter an owner name');
-                return;
-            }
-            
-            const districtCode = districtSelect.value;
-            const talukCode = talukSelect.value;
-            const hobliCode = hobliSelect.value || 'all';
-            const villageCode = villageSelect.value || 'all';
-            
-            if (!districtCode || !talukCode) {
-                alert('Please select District and Taluk');
-                return;
-            }
-            
-            searchRunning = true;
-            searchBtn.innerHTML = '<span class="spinner"></span><span>Stop Search</span>';
-            searchBtn.classList.add('btn-stop');
-            document.getElementById('progressSection').style.display = 'block';
-            
-            addLog('🚀 Starting parallel search...');
-            
-            try {
-                await fetch('/api/search/start', {
-                    method: 'POST',
-                    headers: {'Content-Type': 'application/json'},
-                    body: JSON.stringify({
-                        owner_name: ownerName,
-                        district_code: districtCode,
-                        taluk_code: talukCode,
-                        hobli_code: hobliCode,
-                        village_code: villageCode,
-                        max_survey: parseInt(maxSurveyInput.value) || 200
-                    })
-                });
-                
-                pollInterval = setInterval(pollStatus, 1500);
-            } catch (e) {
-                addLog('❌ Error starting search');
-                stopSearch();
-            }
-        }
-        
-        async function stopSearch() {
-            try {
-                await fetch('/api/search/stop', {method: 'POST'});
-            } catch (e) {}
-            
-            searchRunning = false;
-            searchBtn.innerHTML = '<span>⚡</span><span>Start Parallel Search</span>';
-            searchBtn.classList.remove('btn-stop');
-            
-            if (pollInterval) {
-                clearInterval(pollInterval);
-                pollInterval = null;
-            }
-        }
-        
-        async function pollStatus() {
-            try {
-                const res = await fetch('/api/search/status');
-                const status = await res.json();
-                
-                // Update overall progress
-                document.getElementById('progressPercent').textContent = status.progress + '%';
-                document.getElementById('progressFill').style.width = status.progress + '%';
-                document.getElementById('villagesCompleted').textContent = `${status.villages_completed}/${status.total_villages}`;
-                document.getElementById('totalRecords').textContent = status.total_records;
-                document.getElementById('totalMatches').textContent = status.total_matches;
-                document.getElementById('activeWorkers').textContent = status.active_workers;
-                
-                // Update badges
-                document.getElementById('recordsBadge').textContent = status.total_records;
-                document.getElementById('matchesBadge').textContent = status.total_matches;
-                
-                // Update workers
-                if (status.workers) {
-                    Object.entries(status.workers).forEach(([id, w]) => {
-                        const card = document.getElementById(`worker-${id}`);
-                        if (card) {
-                            card.querySelector('.worker-status').textContent = w.status;
-                            card.querySelector('.worker-status').className = `worker-status ${w.status}`;
-                            card.querySelector('.worker-village').textContent = w.current_village || 'Waiting...';
-                            card.querySelector('.worker-progress-fill').style.width = w.progress + '%';
-                            card.querySelector('.worker-stats').innerHTML = 
-                                `<span>${w.villages_completed}/${w.villages_total} villages</span><span>${w.records_found} records</span>`;
-                        }
-                    });
-                }
-                
-                // Update records tables (real-time)
-                if (status.all_records) {
-                    updateRecordsTable(status.all_records);
-                }
-                if (status.matches) {
-                    updateMatchesTable(status.matches);
-                }
-                
-                // Update logs
-                if (status.logs) {
-                    const container = document.getElementById('logsContainer');
-                    container.innerHTML = status.logs.map(log => 
-                        `<div class="log-entry">${log}</div>`
-                    ).reverse().join('');
-                }
-                
-                // Check if completed
-                if (status.completed || !status.running) {
-                    addLog('✅ Search completed!');
-                    stopSearch();
-                }
-                
-            } catch (e) {}
-        }
-        
-        function addLog(message) {
-            const container = document.getElementById('logsContainer');
-            const entry = document.createElement('div');
-            entry.className = 'log-entry';
-            entry.textContent = new Date().toLocaleTimeString() + ' - ' + message;
-            container.insertBefore(entry, container.firstChild);
-        }
-        
-        // Tab switching
-        let currentTab = 'records';
-        
-        function switchTab(tab) {
-            currentTab = tab;
-            
-            // Update tab buttons
-            document.getElementById('tabRecords').classList.toggle('active', tab === 'records');
-            document.getElementById('tabMatches').classList.toggle('active', tab === 'matches');
-            
-            // Show/hide tables
-            document.getElementById('recordsTable').style.display = tab === 'records' ? 'block' : 'none';
-            document.getElementById('matchesTable').style.display = tab === 'matches' ? 'block' : 'none';
-        }
-        
-        // Update records table
-        function updateRecordsTable(records) {
-            const tbody = document.getElementById('recordsBody');
-            if (!records || records.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="6" class="empty-row">No records yet. Start a search to see results.</td></tr>';
-                return;
-            }
-            
-            // Show last 50 records (most recent first)
-            const recentRecords = records.slice(-50).reverse();
-            tbody.innerHTML = recentRecords.map(r => `
-                <tr>
-                    <td>${r.village || ''}</td>
-                    <td>${r.survey_no || ''}</td>
-                    <td>${r.hissa || ''}</td>
-                    <td class="owner-cell kannada">${r.owner_name || ''}</td>
-                    <td>${r.extent || ''}</td>
-                    <td>W${r.worker_id || 0}</td>
-                </tr>
-            `).join('');
-        }
-        
-        // Update matches table
-        function updateMatchesTable(matches) {
-            const tbody = document.getElementById('matchesBody');
-            if (!matches || matches.length === 0) {
-                tbody.innerHTML = '<tr><td colspan="6" class="empty-row">No matches found yet.</td></tr>';
-                return;
-            }
-            
-            tbody.innerHTML = matches.map(r => `
-                <tr class="match-row">
-                    <td>${r.village || ''}</td>
-                    <td>${r.survey_no || ''}</td>
-                    <td>${r.hissa || ''}</td>
-                    <td class="owner-cell match kannada">${r.owner_name || ''}</td>
-                    <td>${r.extent || ''}</td>
-                    <td>${r.khatah || ''}</td>
-                </tr>
-            `).join('');
-        }
-        
-        // Download Modal Functions
-        async function showDownloadModal() {
-            // Fetch file info
-            try {
-                const res = await fetch('/api/files/info');
-                const info = await res.json();
-                
-                // Update records card
-                document.getElementById('recordsCount').textContent = `${info.all_records.count} records`;
-                document.getElementById('recordsPath').textContent = info.all_records.filename || 'No file yet';
-                document.getElementById('recordsFilename').value = info.all_records.filename || 'all_records.csv';
-                
-                // Update matches card
-                document.getElementById('matchesCount').textContent = `${info.matches.count} matches`;
-                document.getElementById('matchesPath').textContent = info.matches.filename || 'No file yet';
-                document.getElementById('matchesFilename').value = info.matches.filename || 'owner_matches.csv';
-                
-                // Enable/disable download buttons
-                const recordsBtn = document.querySelector('#recordsDownloadCard .btn-download');
-                const matchesBtn = document.querySelector('#matchesDownloadCard .btn-download');
-                
-                recordsBtn.disabled = !info.all_records.exists;
-                matchesBtn.disabled = !info.matches.exists;
-                
-            } catch (e) {
-                console.error('Error fetching file info:', e);
-            }
-            
-            // Show modal
-            document.getElementById('downloadModal').style.display = 'flex';
-        }
-        
-        function hideDownloadModal() {
-            document.getElementById('downloadModal').style.display = 'none';
-        }
-        
-        function downloadFile(fileType) {
-            let filename;
-            if (fileType === 'records') {
-                filename = document.getElementById('recordsFilename').value || 'all_records.csv';
-            } else {
-                filename = document.getElementById('matchesFilename').value || 'owner_matches.csv';
-            }
-            
-            // Ensure .csv extension
-            if (!filename.endsWith('.csv')) {
-                filename += '.csv';
-            }
-            
-            // Trigger download
-            const url = `/api/download/${fileType}?filename=${encodeURIComponent(filename)}`;
-            window.location.href = url;
-            
-            addLog(`📥 Downloaded: ${filename}`);
-        }
-        
-        // Close modal on Escape key
-        document.addEventListener('keydown', (e) => {
-            if (e.key === 'Escape') {
-                hideDownloadModal();
-            }
-        });
-    </script>
+    <script src="/assets/app.js?v={{ asset_version }}"></script>
 </body>
 </html>
 '''
@@ -3574,51 +4911,214 @@ HTML_TEMPLATE = '''
 # ROUTES
 # ═══════════════════════════════════════════════════════════════════════════════════════
 
+# The page only depends on constants, so render it once instead of per request
+with app.app_context():
+    INDEX_HTML = render_template_string(HTML_TEMPLATE, asset_version=ASSET_VERSION,
+                                        max_workers=Config.MAX_WORKERS).encode('utf-8')
+INDEX_ETAG = hashlib.sha1(INDEX_HTML).hexdigest()[:16]
+INDEX_ASSET = _build_asset(INDEX_HTML, 'text/html')
+
+def _precompressed_response(asset: dict, etag: str) -> Response:
+    """Pick brotli > gzip > identity by Accept-Encoding; no per-request compression"""
+    encoding = 'identity'
+    for candidate in ('br', 'gzip'):
+        if candidate in asset['variants'] and request.accept_encodings[candidate]:
+            encoding = candidate
+            break
+    
+    response = Response(asset['variants'][encoding], mimetype=asset['mimetype'])
+    if encoding != 'identity':
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    response.set_etag(f"{etag}-{encoding}")
+    return response
+
 @app.route('/')
 def index():
-    return render_template_string(HTML_TEMPLATE)
+    response = _precompressed_response(INDEX_ASSET, INDEX_ETAG)
+    response.cache_control.no_cache = True  # Revalidate so new asset versions are picked up
+    return response.make_conditional(request)
+
+def _asset_response(name: str):
+    """Serve a precompressed UI asset with long-lived cache headers"""
+    response = _precompressed_response(STATIC_ASSETS[name], ASSET_VERSION)
+    response.cache_control.public = True
+    response.cache_control.max_age = ASSET_MAX_AGE
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+@app.route('/assets/app.css')
+def app_css():
+    return _asset_response('app.css')
+
+@app.route('/assets/app.js')
+def app_js():
+    return _asset_response('app.js')
+
+def ojsonify(obj) -> Response:
+    """jsonify() replacement for large record/status payloads"""
+    return Response(dumps_json(obj), mimetype='application/json')
+
+@app.after_request
+def compress_json_response(response: Response) -> Response:
+    """Gzip JSON bodies over JSON_GZIP_MIN_SIZE for clients that accept it"""
+    if (response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or not 200 <= response.status_code < 300):
+        return response
+    response.vary.add('Accept-Encoding')
+    if not request.accept_encodings['gzip']:
+        return response
+    
+    body = response.get_data()
+    if len(body) < Config.JSON_GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=Config.JSON_GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+def _list_response(items: List[dict]):
+    """JSON location list; browsers may reuse non-empty lists for a while"""
+    response = ojsonify(items)
+    if items:  # Empty means the upstream call failed, let the client retry
+        response.cache_control.public = True
+        response.cache_control.max_age = Config.LIST_MAX_AGE
+    return response
 
 @app.route('/api/districts')
 def get_districts():
-    return jsonify(api.get_districts())
+    return _list_response(api.get_districts())
 
 @app.route('/api/taluks/<int:district_code>')
 def get_taluks(district_code):
-    return jsonify(api.get_taluks(district_code))
+    return _list_response(api.get_taluks(district_code))
 
 @app.route('/api/hoblis/<int:district_code>/<int:taluk_code>')
 def get_hoblis(district_code, taluk_code):
-    return jsonify(api.get_hoblis(district_code, taluk_code))
+    return _list_response(api.get_hoblis(district_code, taluk_code))
 
 @app.route('/api/villages/<int:district_code>/<int:taluk_code>/<int:hobli_code>')
 def get_villages(district_code, taluk_code, hobli_code):
-    return jsonify(api.get_villages(district_code, taluk_code, hobli_code))
+    return _list_response(api.get_villages(district_code, taluk_code, hobli_code))
+
+@app.route('/api/cache/clear', methods=['POST'])
+def clear_api_cache():
+    """Forget cached location lookups (e.g. after upstream data changes)"""
+    cleared = api.clear_cache()
+    return jsonify({'status': 'cleared', 'entries': cleared})
 
 @app.route('/api/search/start', methods=['POST'])
 def start_search():
-    global coordinator
     data = request.json
     
     # Create new coordinator for each search
-    coordinator = ParallelSearchCoordinator()
+    coordinator = replace_coordinator()
     success = coordinator.start_search(data)
     
     return jsonify({'status': 'started' if success else 'failed'})
 
+def _unsent_tail(items: list, total: int, sent: int) -> list:
+    """Items of a trimmed buffer that were appended after `sent` of `total`"""
+    fresh = min(total - sent, len(items))
+    return items[len(items) - fresh:] if fresh > 0 else []
+
 @app.route('/api/search/status')
 def search_status():
-    return jsonify(coordinator.get_state())
+    """Search state. With ?since=<rows seen>&logs_since=<lines seen> only the
+    record rows and log lines after those cursors are included."""
+    state = get_coordinator().get_state()
+    since = request.args.get('since', type=int)
+    if since is not None:
+        state['all_records'] = _unsent_tail(state['all_records'], state['all_records_total'], since)
+    logs_since = request.args.get('logs_since', type=int)
+    if logs_since is not None:
+        state['logs'] = _unsent_tail(state['logs'], state['logs_total'], logs_since)
+    return ojsonify(state)
+
+@app.route('/api/search/stream')
+def search_stream():
+    """Push status frames as Server-Sent Events whenever the state changes.
+    
+    Each stream remembers how many log lines and record rows it has sent and
+    only ships the new ones, so frame size follows the rate of change rather
+    than the size of the buffers.
+    """
+    def event_stream():
+        logs_sent = records_sent = 0
+        last_summary = None
+        last_sent_at = time.time()
+        yield b'retry: 5000\n\n'
+        
+        while True:
+            state = get_coordinator().get_state()
+            if state['logs_total'] < logs_sent or state['all_records_total'] < records_sent:
+                logs_sent = records_sent = 0  # New search, counters restarted
+            state['logs'] = _unsent_tail(state['logs'], state['logs_total'], logs_sent)
+            state['all_records'] = _unsent_tail(state['all_records'], state['all_records_total'], records_sent)
+            logs_sent, records_sent = state['logs_total'], state['all_records_total']
+            
+            # Everything except the delta lists, to tell whether anything moved
+            summary = dumps_json({k: v for k, v in state.items() if k not in ('logs', 'all_records')})
+            if summary != last_summary or state['logs'] or state['all_records']:
+                yield b'data: ' + dumps_json(state) + b'\n\n'
+                last_summary = summary
+                last_sent_at = time.time()
+            elif time.time() - last_sent_at > Config.STATUS_STREAM_HEARTBEAT:
+                yield b': keep-alive\n\n'
+                last_sent_at = time.time()
+            
+            if not state['running']:
+                break
+            time.sleep(Config.STATUS_STREAM_INTERVAL)
+    
+    return Response(event_stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 @app.route('/api/search/stop', methods=['POST'])
 def stop_search():
-    coordinator.stop_search()
+    get_coordinator().stop_search()
     return jsonify({'status': 'stopped'})
 
+STREAM_CHUNK_SIZE = 65536  # 64 KiB per chunk for streamed downloads
+
+def _set_attachment(response: Response, filename: str, fallback_name: str = 'download.csv'):
+    """Set Content-Disposition, with an RFC 5987 filename* for Kannada names"""
+    try:
+        filename.encode('ascii')
+        response.headers.set('Content-Disposition', 'attachment', filename=filename)
+    except UnicodeEncodeError:
+        fallback = filename.encode('ascii', 'ignore').decode()
+        if not re.sub(r'\.csv$', '', fallback).strip(' ._-'):
+            fallback = fallback_name
+        response.headers.set('Content-Disposition', 'attachment', filename=fallback,
+                             **{'filename*': f"UTF-8''{quote(filename)}"})
+
+def _stream_file_response(filepath: str, download_name: str, fallback_name: str = 'download.csv',
+                          mimetype: str = 'text/csv') -> Response:
+    """Stream a file as an attachment in fixed-size chunks.
+    
+    The file is read as the client consumes it, so memory stays constant and
+    files still being appended to (live search CSVs) can be downloaded.
+    """
+    def generate():
+        with open(filepath, 'rb') as f:
+            while True:
+                chunk = f.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+    
+    response = Response(generate(), mimetype=mimetype, direct_passthrough=True)
+    _set_attachment(response, download_name, fallback_name)
+    return response
+
 @app.route('/api/download/<file_type>')
 def download_csv(file_type):
-    """Download CSV file with custom filename"""
-    from flask import send_file, request
-    
+    """Download CSV file with custom filename (streamed in chunks)"""
+    coordinator = get_coordinator()
+    coordinator.flush_outputs()
     state = coordinator.get_state()
     
     if file_type == 'records':
@@ -3638,43 +5138,40 @@ def download_csv(file_type):
     if not custom_name.endswith('.csv'):
         custom_name += '.csv'
     
-    return send_file(
-        filepath,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=custom_name
-    )
+    return _stream_file_response(filepath, custom_name, fallback_name=default_name)
+
+@lru_cache(maxsize=8)
+def _stat_size(filepath: str, time_bucket: int) -> Optional[int]:
+    """File size from a single stat(), None if missing; time_bucket expires entries"""
+    try:
+        return os.stat(filepath).st_size
+    except OSError:
+        return None
+
+def _file_info(filepath: str, count: int) -> dict:
+    """Download-modal info for one CSV, re-stat'ed at most every 2 seconds"""
+    size = _stat_size(filepath, int(time.time() / 2)) if filepath else None
+    info = {
+        'exists': size is not None,
+        'filename': os.path.basename(filepath) if filepath else '',
+        'filepath': filepath,
+        'count': count
+    }
+    if size is not None:
+        info['size'] = size
+    return info
 
 @app.route('/api/files/info')
 def get_files_info():
     """Get info about saved CSV files"""
+    coordinator = get_coordinator()
+    coordinator.flush_outputs()
     state = coordinator.get_state()
     
-    all_records_file = state.get('all_records_file', '')
-    matches_file = state.get('matches_file', '')
-    
-    result = {
-        'all_records': {
-            'exists': os.path.exists(all_records_file) if all_records_file else False,
-            'filename': os.path.basename(all_records_file) if all_records_file else '',
-            'filepath': all_records_file,
-            'count': state.get('total_records', 0)
-        },
-        'matches': {
-            'exists': os.path.exists(matches_file) if matches_file else False,
-            'filename': os.path.basename(matches_file) if matches_file else '',
-            'filepath': matches_file,
-            'count': state.get('total_matches', 0)
-        }
-    }
-    
-    # Get file sizes if they exist
-    if result['all_records']['exists']:
-        result['all_records']['size'] = os.path.getsize(all_records_file)
-    if result['matches']['exists']:
-        result['matches']['size'] = os.path.getsize(matches_file)
-    
-    return jsonify(result)
+    return jsonify({
+        'all_records': _file_info(state.get('all_records_file', ''), state.get('total_records', 0)),
+        'matches': _file_info(state.get('matches_file', ''), state.get('total_matches', 0))
+    })
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
@@ -3685,12 +5182,16 @@ def get_files_info():
 def get_database_info():
     """Get database information and statistics"""
     db = get_database()
+    try:
+        size = os.stat(db.db_path).st_size
+    except OSError:
+        size = None
     return jsonify({
         'db_path': db.db_path,
         'db_folder': db.db_folder,
         'total_records': db.get_all_records_count(),
-        'exists': os.path.exists(db.db_path),
-        'size_mb': round(os.path.getsize(db.db_path) / (1024 * 1024), 2) if os.path.exists(db.db_path) else 0
+        'exists': size is not None,
+        'size_mb': round(size / (1024 * 1024), 2) if size is not None else 0
     })
 
 @app.route('/api/db/sessions')
@@ -3699,39 +5200,39 @@ def get_search_sessions():
     db = get_database()
     limit = request.args.get('limit', 20, type=int)
     sessions = db.get_recent_sessions(limit)
-    return jsonify(sessions)
+    return ojsonify(sessions)
 
 @app.route('/api/db/sessions/<session_id>')
 def get_session_details(session_id):
     """Get details for a specific session"""
     db = get_database()
-    session = db.get_session(session_id)
+    session = db.get_session_with_stats(session_id)
     if not session:
         return jsonify({'error': 'Session not found'}), 404
-    
-    stats = db.get_session_stats(session_id)
-    session.update(stats)
     return jsonify(session)
 
 @app.route('/api/db/sessions/<session_id>/records')
 def get_session_records(session_id):
-    """Get records for a session"""
+    """Get records for a session (?before_id= / ?after_id= continue from next_cursor)"""
     db = get_database()
     limit = request.args.get('limit', 100, type=int)
     matches_only = request.args.get('matches_only', 'false').lower() == 'true'
+    after_id = request.args.get('after_id', type=int)
+    before_id = request.args.get('before_id', type=int)
     
-    records = db.get_session_records(session_id, limit=limit, matches_only=matches_only)
-    return jsonify({
+    records = db.get_session_records(session_id, limit=limit, matches_only=matches_only,
+                                     after_id=after_id, before_id=before_id)
+    return ojsonify({
         'session_id': session_id,
         'count': len(records),
-        'records': records
+        'records': records,
+        # Pass back as the same cursor parameter to get the next page
+        'next_cursor': records[-1]['id'] if limit and len(records) == limit else None
     })
 
 @app.route('/api/db/sessions/<session_id>/export')
 def export_session_to_csv(session_id):
     """Export session records to CSV"""
-    from flask import send_file
-    
     db = get_database()
     matches_only = request.args.get('matches_only', 'false').lower() == 'true'
     
@@ -3742,19 +5243,27 @@ def export_session_to_csv(session_id):
     
     suffix = '_matches' if matches_only else '_all'
     filename = f"bhoomi_export_{session_id}{suffix}.csv"
-    filepath = os.path.join(db.db_folder, filename)
-    
-    db.export_to_csv(session_id, filepath, matches_only=matches_only)
     
-    if not os.path.exists(filepath):
+    # Stream straight from SQLite; no temp file in db_folder
+    batches = db.iter_session_batches(session_id, matches_only=matches_only, batch_size=500)
+    first = next(batches, None)
+    if first is None:
+        batches.close()
         return jsonify({'error': 'No records to export'}), 404
     
-    return send_file(
-        filepath,
-        mimetype='text/csv',
-        as_attachment=True,
-        download_name=filename
-    )
+    def generate():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(db.EXPORT_FIELDNAMES)
+        for batch in itertools.chain((first,), batches):
+            writer.writerows(batch)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+    
+    response = Response(stream_with_context(generate()), mimetype='text/csv')
+    _set_attachment(response, filename)
+    return response
 
 @app.route('/api/db/search')
 def search_database():
@@ -3767,7 +5276,7 @@ def search_database():
         return jsonify({'error': 'Query parameter "q" is required'}), 400
     
     records = db.search_records(owner_name, limit=limit)
-    return jsonify({
+    return ojsonify({
         'query': owner_name,
         'count': len(records),
         'records': records
@@ -3778,7 +5287,7 @@ def get_resumable_sessions():
     """Get sessions that can be resumed"""
     db = get_database()
     sessions = db.get_resumable_sessions()
-    return jsonify(sessions)
+    return ojsonify(sessions)
 
 # ═══════════════════════════════════════════════════════════════════════════════════════
 # MAIN
@@ -3802,5 +5311,21 @@ if __name__ == '__main__':
 ║                                                                                      ║
 ╚══════════════════════════════════════════════════════════════════════════════════════╝
     """)
-    app.run(host=Config.HOST, port=Config.PORT, debug=Config.DEBUG, threaded=True)
+    # Connect to the portal while the server starts, not on the first dropdown
+    threading.Thread(target=api.warm_up, name='api-warm-up', daemon=True).start()
+    
+    # Search state lives in this process (app-bound coordinator), so serve with
+    # one process and many threads: SSE streams and CSV downloads each hold
+    # a thread for their whole duration. Prefer waitress over the dev server.
+    try:
+        from waitress import serve
+    except ImportError:
+        serve = None
+    
+    if serve is not None:
+        logger.info(f"🌐 Serving with waitress ({Config.SERVER_THREADS} threads)")
+        serve(app, host=Config.HOST, port=Config.PORT, threads=Config.SERVER_THREADS,
+              channel_timeout=300)
+    else:
+        app.run(host=Config.HOST, port=Config.PORT, debug=Config.DEBUG, threaded=True)
 